@@ -3,17 +3,89 @@ AI Analysis module using LangChain with OpenAI and Gemini for website screenshot
 """
 
 import os
-import base64
+import asyncio
+import httpx
+from functools import lru_cache
 from langchain_openai import ChatOpenAI
 from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import HumanMessage
 from dotenv import load_dotenv
 import getpass
+from utils.encoding import encode_base64
 
 load_dotenv()
 
 
+# Shared by every ChatOpenAI instance so API calls reuse pooled connections
+# instead of paying a TLS handshake per analysis; HTTP/2 lets concurrent
+# calls multiplex over the same connection
+_openai_http_client = None
+
+
+def get_openai_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client used for OpenAI calls."""
+    global _openai_http_client
+    if _openai_http_client is None or _openai_http_client.is_closed:
+        _openai_http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(120),
+        )
+    return _openai_http_client
+
+
+async def close_openai_http_client() -> None:
+    """Close the shared OpenAI HTTP client; call once at shutdown."""
+    global _openai_http_client
+    # Cached clients hold the HTTP client; drop them along with it
+    get_openai_llm.cache_clear()
+    if _openai_http_client is not None:
+        await _openai_http_client.aclose()
+        _openai_http_client = None
+
+
+@lru_cache(maxsize=4)
+def get_openai_llm(
+    model: str, api_key: str, max_tokens: int, temperature: float, seed: int
+) -> ChatOpenAI:
+    """Return a shared ChatOpenAI client for these settings."""
+    return ChatOpenAI(
+        model=model,
+        openai_api_key=api_key,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        seed=seed,
+        http_async_client=get_openai_http_client(),
+    )
+
+
+@lru_cache(maxsize=4)
+def get_gemini_llm(
+    model: str, api_key: str, max_tokens: int, temperature: float
+) -> ChatGoogleGenerativeAI:
+    """Return a shared Gemini client for these settings."""
+    return ChatGoogleGenerativeAI(
+        model=model,
+        google_api_key=api_key,
+        max_output_tokens=max_tokens,
+        temperature=temperature,
+    )
+
+
+@lru_cache(maxsize=64)
+def _format_prompt(template: str, load_time: float, performance_info: str) -> str:
+    """Fill the per-call fields of a prompt template, memoized by inputs."""
+    return template.format(load_time=load_time, performance_info=performance_info)
+
+
+class AIAnalysisUnavailableError(Exception):
+    """Raised when the AI provider could not analyze the screenshots."""
+
+
 class AIScreenshotAnalyzer:
     """Handles AI-powered analysis of website screenshots using OpenAI Vision or Gemini Vision."""
 
@@ -37,10 +109,54 @@ class AIScreenshotAnalyzer:
         "R13": "Inconsistent spacing between elements is leading to a cluttered and unappealing design.",
     }
 
+    # Prompt block listing every response; R2 keeps its {load_time} field
+    RESPONSE_EXAMPLES = "\n".join(
+        f"{key}. {template}" for key, template in RESPONSE_TEMPLATES.items()
+    )
+
+    # Analysis prompt; {threshold} and {response_examples} are filled once per
+    # analyzer, the doubled fields on every call
+    ANALYSIS_PROMPT = """
+        You are a UX/UI expert conducting a systematic website analysis. Analyze these screenshots methodically and return ONLY the failed criteria.
+
+        ANALYSIS CRITERIA:
+        1. Hero section clarity: Can you immediately understand what this website offers? (Check the text written in the hero section; if no text, then no user can understand means FAIL, and if present, it should be short and to the point.)
+        2. Load time: {{load_time:.1f}} seconds{{performance_info}} (FAIL if > {threshold} seconds)
+        3. Call-to-Action: Is there a prominent CTA button in the hero section?
+        4. Mobile responsiveness: Compare desktop vs mobile - are they properly adapted?
+        5. Human connection: Are there visible human faces or emotional imagery?
+        6. Design consistency: Are fonts, colors, and layouts uniform?(The number of different fonts should be less than 3, and the number of different colors should be less than 5.)
+        7. Navigation: Is the menu structure clear and logical?
+        8. Interactive elements: Do buttons/links appear clickable?
+        9. Search functionality: Is there a visible search feature?(If the search bar is present, it should be functional and easy to find.)
+        10. Content organization: Is text well-structured and not overwhelming?(short and concise text is preferred)
+        11. Text contrast: Is text easily readable against backgrounds?
+        12. Text alignment: Are there obvious alignment problems?(Check for misaligned text, images, or buttons that disrupt the layout.)
+        13. Element spacing: Is spacing between elements consistent and clean?
+
+        STRICT INSTRUCTIONS:
+        - Examine BOTH desktop and mobile screenshots carefully
+        - Only return responses for criteria that clearly FAIL
+        - Use exact response format below
+        - Be consistent in your evaluation
+
+        RESPONSE FORMAT (return only failed ones):
+        {response_examples}
+
+        Return only the R responses that apply, one per line.
+        """
+
     def __init__(self, config):
         """Initialize the AI analyzer with configuration."""
         self.config = config
         self.provider = getattr(config, "ai_provider", "openai").lower()
+        self._image_mime = f"image/{getattr(config, 'screenshot_format', 'png')}"
+
+        # Everything but the load time line is fixed, so build it once
+        self._prompt_template = self.ANALYSIS_PROMPT.format(
+            threshold=config.load_time_threshold,
+            response_examples=self.RESPONSE_EXAMPLES,
+        )
 
         if self.provider not in self.SUPPORTED_PROVIDERS:
             raise ValueError(
@@ -63,12 +179,12 @@ class AIScreenshotAnalyzer:
                 "Enter your Google AI API key: "
             )
 
-        self.llm = ChatOpenAI(
-            model=self.config.openai_model,
-            openai_api_key=self.openai_key,
-            max_tokens=self.config.openai_max_tokens,
-            temperature=self.config.openai_temperature,
-            seed=self.config.openai_seed,
+        self.llm = get_openai_llm(
+            self.config.openai_model,
+            self.openai_key,
+            self.config.openai_max_tokens,
+            self.config.openai_temperature,
+            self.config.openai_seed,
         )
 
     def _init_gemini(self):
@@ -82,11 +198,8 @@ class AIScreenshotAnalyzer:
         gemini_max_tokens = getattr(self.config, "gemini_max_tokens", 1500)
         gemini_temperature = getattr(self.config, "gemini_temperature", 0.0)
 
-        self.llm = ChatGoogleGenerativeAI(
-            model=gemini_model,
-            google_api_key=self.gemini_key,
-            max_output_tokens=gemini_max_tokens,
-            temperature=gemini_temperature,
+        self.llm = get_gemini_llm(
+            gemini_model, self.gemini_key, gemini_max_tokens, gemini_temperature
         )
 
     async def analyze_screenshots(
@@ -101,12 +214,10 @@ class AIScreenshotAnalyzer:
 
         print(f"🤖 Using {self.provider.upper()} for AI analysis...")
 
-        # Convert images to base64
-        with open(desktop_screenshot, "rb") as f:
-            desktop_b64 = base64.b64encode(f.read()).decode()
-
-        with open(mobile_screenshot, "rb") as f:
-            mobile_b64 = base64.b64encode(f.read()).decode()
+        # Convert image bytes to base64, both at once
+        desktop_b64, mobile_b64 = await asyncio.gather(
+            encode_base64(desktop_screenshot), encode_base64(mobile_screenshot)
+        )
 
         # Use Lighthouse metrics if available, otherwise fall back to Playwright timing
         if lighthouse_data and lighthouse_data.get("available"):
@@ -126,10 +237,10 @@ class AIScreenshotAnalyzer:
 
         try:
             response = await self.llm.ainvoke(messages)
-            return response.content.strip()
         except Exception as e:
             print(f"❌ {self.provider.upper()} analysis failed: {e}")
-            return "AI analysis not available"
+            raise AIAnalysisUnavailableError(str(e)) from e
+        return response.content.strip()
 
     def _create_openai_messages(self, prompt, desktop_b64, mobile_b64):
         """Create messages format for OpenAI Vision"""
@@ -140,15 +251,15 @@ class AIScreenshotAnalyzer:
                     {
                         "type": "image_url",
                         "image_url": {
-                            "url": f"data:image/png;base64,{desktop_b64}",
-                            "detail": "high",
+                            "url": f"data:{self._image_mime};base64,{desktop_b64}",
+                            "detail": self.config.openai_image_detail,
                         },
                     },
                     {
                         "type": "image_url",
                         "image_url": {
-                            "url": f"data:image/png;base64,{mobile_b64}",
-                            "detail": "high",
+                            "url": f"data:{self._image_mime};base64,{mobile_b64}",
+                            "detail": self.config.openai_mobile_image_detail,
                         },
                     },
                 ]
@@ -164,13 +275,13 @@ class AIScreenshotAnalyzer:
                     {
                         "type": "image_url",
                         "image_url": {
-                            "url": f"data:image/png;base64,{desktop_b64}",
+                            "url": f"data:{self._image_mime};base64,{desktop_b64}",
                         },
                     },
                     {
                         "type": "image_url",
                         "image_url": {
-                            "url": f"data:image/png;base64,{mobile_b64}",
+                            "url": f"data:{self._image_mime};base64,{mobile_b64}",
                         },
                     },
                 ]
@@ -178,40 +289,8 @@ class AIScreenshotAnalyzer:
         ]
 
     def _generate_analysis_prompt(self, actual_load_time, performance_info):
-        """Generate the AI analysis prompt with dynamic response templates"""
-        response_examples = "\n".join(
-            [
-                f"{key}. {template.format(load_time=actual_load_time) if 'load_time' in template else template}"
-                for key, template in self.RESPONSE_TEMPLATES.items()
-            ]
+        """Generate the AI analysis prompt from the precomputed template"""
+        # The prompt shows one decimal, so round before using it as a key
+        return _format_prompt(
+            self._prompt_template, round(actual_load_time, 1), performance_info
         )
-
-        return f"""
-        You are a UX/UI expert conducting a systematic website analysis. Analyze these screenshots methodically and return ONLY the failed criteria.
-
-        ANALYSIS CRITERIA:
-        1. Hero section clarity: Can you immediately understand what this website offers? (Check the text written in the hero section; if no text, then no user can understand means FAIL, and if present, it should be short and to the point.)
-        2. Load time: {actual_load_time:.1f} seconds{performance_info} (FAIL if > {self.config.load_time_threshold} seconds)
-        3. Call-to-Action: Is there a prominent CTA button in the hero section?
-        4. Mobile responsiveness: Compare desktop vs mobile - are they properly adapted?
-        5. Human connection: Are there visible human faces or emotional imagery?
-        6. Design consistency: Are fonts, colors, and layouts uniform?(The number of different fonts should be less than 3, and the number of different colors should be less than 5.)
-        7. Navigation: Is the menu structure clear and logical?
-        8. Interactive elements: Do buttons/links appear clickable?
-        9. Search functionality: Is there a visible search feature?(If the search bar is present, it should be functional and easy to find.)
-        10. Content organization: Is text well-structured and not overwhelming?(short and concise text is preferred)
-        11. Text contrast: Is text easily readable against backgrounds?
-        12. Text alignment: Are there obvious alignment problems?(Check for misaligned text, images, or buttons that disrupt the layout.)
-        13. Element spacing: Is spacing between elements consistent and clean?
-
-        STRICT INSTRUCTIONS:
-        - Examine BOTH desktop and mobile screenshots carefully
-        - Only return responses for criteria that clearly FAIL
-        - Use exact response format below
-        - Be consistent in your evaluation
-
-        RESPONSE FORMAT (return only failed ones):
-        {response_examples}
-
-        Return only the R responses that apply, one per line.
-        """
@@ -1,102 +1,402 @@
-import os
+import re
 import sys
+import socket
 import asyncio
-import json
 import httpx
+import orjson
+from contextlib import asynccontextmanager, suppress
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
 from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from config.config import default_config
-from ai.ai_analyzer import AIScreenshotAnalyzer
+from ai.ai_analyzer import (
+    AIAnalysisUnavailableError,
+    AIScreenshotAnalyzer,
+    close_openai_http_client,
+)
 
 load_dotenv()
 
+# Resource types that never show up in a static screenshot
+BLOCKED_RESOURCE_TYPES = frozenset({"media", "websocket", "eventsource"})
+
+# Analytics and ad hosts that only add network chatter to a page load
+BLOCKLIST = frozenset(
+    {
+        "google-analytics.com",
+        "googletagmanager.com",
+        "doubleclick.net",
+        "googlesyndication.com",
+        "adservice.google.com",
+        "facebook.net",
+        "connect.facebook.net",
+        "hotjar.com",
+        "segment.io",
+        "mixpanel.com",
+        "clarity.ms",
+    }
+)
+
+
+# Lighthouse audits to extract: (audit key, metric name, divisor to target unit)
+METRIC_SPEC = (
+    ("first-contentful-paint", "fcp_seconds", 1000),
+    ("largest-contentful-paint", "lcp_seconds", 1000),
+    ("cumulative-layout-shift", "cls_value", 1),
+    ("total-blocking-time", "tbt_ms", 1),
+)
+
+# PSI partial-response selector: only the score and the audits read above,
+# instead of the full multi-MB Lighthouse report
+PSI_FIELDS = "lighthouseResult(categories/performance/score,audits({}))".format(
+    ",".join(f"{audit_key}/numericValue" for audit_key, _, _ in METRIC_SPEC)
+)
+
+
+# Single-pass URL -> filename sanitization used when saving screenshots
+_URL_SCHEMES = ("https://", "http://")
+_FILENAME_TRANS = str.maketrans({"/": "_", "?": "_", ":": "_"})
+
+# Timeouts surfaced as plain errors, e.g. Chromium's net::ERR_TIMED_OUT
+_TIMEOUT_RE = re.compile(r"timeout|timed[ _]out", re.IGNORECASE)
+
+
+def _is_blocked_host(url: str) -> bool:
+    """Whether the URL's host is a BLOCKLIST domain or one of its subdomains."""
+    host = urlsplit(url).hostname
+    if not host:
+        return False
+    labels = host.split(".")
+    return any(".".join(labels[i:]) in BLOCKLIST for i in range(len(labels)))
+
+
+async def _block_heavy_resources(route):
+    """Abort requests that do not contribute to the rendered layout."""
+    request = route.request
+    # Never block the page under analysis, even when it is a tracker's own site
+    if not request.is_navigation_request() and (
+        request.resource_type in BLOCKED_RESOURCE_TYPES or _is_blocked_host(request.url)
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# One Playwright driver per process, shared by every pool
+_PLAYWRIGHT_SINGLETON = None
+_playwright_lock = asyncio.Lock()
+
+
+async def get_playwright():
+    """Start the process-wide Playwright driver on first use and return it."""
+    global _PLAYWRIGHT_SINGLETON
+    async with _playwright_lock:
+        if _PLAYWRIGHT_SINGLETON is None:
+            _PLAYWRIGHT_SINGLETON = await async_playwright().start()
+        return _PLAYWRIGHT_SINGLETON
+
+
+async def stop_playwright():
+    """Stop the shared Playwright driver; call once at process shutdown."""
+    global _PLAYWRIGHT_SINGLETON
+    async with _playwright_lock:
+        if _PLAYWRIGHT_SINGLETON is not None:
+            with suppress(Exception):
+                await _PLAYWRIGHT_SINGLETON.stop()
+            _PLAYWRIGHT_SINGLETON = None
+
 
 class ChromiumPool:
-    def __init__(self, max_browsers=4, max_tabs_per_browser=8):
+    PROFILES = ("desktop", "mobile")
+
+    def __init__(self, max_browsers=4, max_tabs_per_browser=8, config=None):
         self.max_browsers = max_browsers
         self.max_tabs_per_browser = max_tabs_per_browser
+        self.config = config or default_config
         self.browsers = []
+        # Persistent per-profile contexts for each browser, keyed by browser
+        self.contexts = {}
         self.lock = asyncio.Lock()
         self.playwright = None
+        # Each slot is one tab; waiters park here (FIFO) instead of failing
+        self._slot_sem = asyncio.Semaphore(max_browsers * max_tabs_per_browser)
+        # Pages released back to the pool, ready to be handed out again
+        self._idle = {profile: asyncio.Queue() for profile in self.PROFILES}
+        # Tabs reserved under the lock but still being opened, per browser
+        self._pending = {}
+        # page -> (browser, pages list, profile) for O(1) release lookups
+        self._page_index = {}
+        # Set once warmup() has launched the initial browsers
+        self.ready = False
 
     async def start(self):
         if not self.playwright:
-            self.playwright = await async_playwright().start()
+            self.playwright = await get_playwright()
+
+    def is_alive(self) -> bool:
+        """Cheap liveness check from cached state; never launches anything."""
+        return bool(self.browsers) and all(
+            browser.is_connected() for browser, _ in self.browsers
+        )
+
+    async def warmup(self, browsers=None):
+        """
+        Launch browsers concurrently ahead of traffic and mark the pool ready.
 
-    async def acquire(self):
+        The pool is ready once at least one browser is up; acquire() launches
+        the rest on demand. Raises only if no browser could be launched.
+        """
+        await self.start()
         async with self.lock:
-            # Try to find a browser with available tab slot
-            for browser, pages in self.browsers:
-                if len(pages) < self.max_tabs_per_browser:
-                    page = await browser.new_page()
-                    pages.append(page)
-                    return browser, page
-            # If all browsers are full and we can create a new one
-            if len(self.browsers) < self.max_browsers:
-                # Launch Chromium with Docker-friendly flags to avoid sandbox and shared memory issues
-                browser = await self.playwright.chromium.launch(
-                    headless=True,
-                    args=[
-                        "--no-sandbox",
-                        "--disable-setuid-sandbox",
-                        "--disable-dev-shm-usage",
-                        "--disable-gpu",
-                    ],
-                )
-                page = await browser.new_page()
-                self.browsers.append((browser, [page]))
-                return browser, page
-            # All browsers are full, wait for a slot
-            # (In production, you may want a queue or timeout here)
-            raise RuntimeError(
-                "All Chromium browsers and tabs are busy. Please try again later."
+            count = self.max_browsers if browsers is None else browsers
+            count = min(count, self.max_browsers - len(self.browsers))
+            launched = await asyncio.gather(
+                *(self._launch_browser() for _ in range(count)),
+                return_exceptions=True,
+            )
+            errors = [r for r in launched if isinstance(r, BaseException)]
+            self.browsers.extend(
+                (b, []) for b in launched if not isinstance(b, BaseException)
             )
+            if errors and not self.browsers:
+                raise errors[0]
+        if errors:
+            print(f"⚠️  {len(errors)} of {count} browsers failed to launch: {errors[0]}")
+        self.ready = True
+
+    async def acquire(self, profile="desktop"):
+        await self._slot_sem.acquire()
+        try:
+            # Fast path: reuse an idle page from the matching context
+            try:
+                return self._idle[profile].get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+
+            async with self.lock:
+                # A page of this profile may have been released while we
+                # waited for the lock; hand it out rather than open a tab
+                try:
+                    return self._idle[profile].get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+                browser, pages, evicted = await self._reserve_tab(profile)
+
+            # Open the tab and tear down the recycled page outside the lock,
+            # so slow page operations don't hold up other acquirers
+            try:
+                page = await self.contexts[browser][profile].new_page()
+            finally:
+                self._pending[browser] -= 1
+                if evicted:
+                    with suppress(Exception):
+                        await evicted.close()
+            pages.append(page)
+            self._page_index[page] = (browser, pages, profile)
+            return browser, page
+        except BaseException:
+            self._slot_sem.release()
+            raise
+
+    @asynccontextmanager
+    async def borrow(self, profile="desktop"):
+        """Acquire a page for the duration of an ``async with`` block."""
+        browser, page = await self.acquire(profile)
+        try:
+            yield browser, page
+        finally:
+            await self.release(page)
+
+    async def _reserve_tab(self, profile):
+        """Reserve a tab slot for profile. Caller must hold self.lock.
+
+        Returns (browser, pages, evicted): the caller opens the page in
+        browser, appends it to pages and decrements self._pending[browser].
+        evicted is an idle page of the other profile that was dropped to make
+        room and must be closed.
+        """
+        # Try to find a browser with available tab slot
+        for browser, pages in self.browsers:
+            if len(pages) + self._pending.get(browser, 0) < self.max_tabs_per_browser:
+                return self._reserve(browser, pages, None)
+
+        if len(self.browsers) < self.max_browsers:
+            browser = await self._launch_browser()
+            pages = []
+            self.browsers.append((browser, pages))
+            return self._reserve(browser, pages, None)
+
+        # Every tab is taken, but since we hold a slot at least one of
+        # them is idle, and acquire() already ruled out this profile's:
+        # recycle one from the other profile
+        for other in self.PROFILES:
+            if other == profile:
+                continue
+            try:
+                _, idle_page = self._idle[other].get_nowait()
+            except asyncio.QueueEmpty:
+                continue
+            browser, pages, _ = self._page_index.pop(idle_page)
+            pages.remove(idle_page)
+            return self._reserve(browser, pages, idle_page)
+
+        # Only reachable if the tab accounting drifted; serve the request
+        # from the least loaded browser rather than fail it
+        browser, pages = min(
+            self.browsers,
+            key=lambda entry: len(entry[1]) + self._pending.get(entry[0], 0),
+        )
+        return self._reserve(browser, pages, None)
+
+    def _reserve(self, browser, pages, evicted):
+        self._pending[browser] = self._pending.get(browser, 0) + 1
+        return browser, pages, evicted
+
+    async def _launch_browser(self):
+        """Launch a browser along with its desktop and mobile contexts."""
+        # Launch Chromium with Docker-friendly flags to avoid sandbox and shared memory issues
+        browser = await self.playwright.chromium.launch(
+            headless=True,
+            args=[
+                "--no-sandbox",
+                "--disable-setuid-sandbox",
+                "--disable-dev-shm-usage",
+                "--disable-gpu",
+            ],
+        )
+        desktop, mobile = await asyncio.gather(
+            browser.new_context(viewport=self.config.desktop_viewport),
+            browser.new_context(
+                viewport=self.config.mobile_viewport,
+                user_agent=self.config.mobile_user_agent,
+            ),
+        )
+        if self.config.block_heavy_resources:
+            # Registered once per context; every page opened in it inherits it
+            await asyncio.gather(
+                desktop.route("**/*", _block_heavy_resources),
+                mobile.route("**/*", _block_heavy_resources),
+            )
+        self.contexts[browser] = {"desktop": desktop, "mobile": mobile}
+        return browser
 
     async def release(self, page):
+        try:
+            # Reset the page so the next borrower starts from a clean slate
+            await page.goto("about:blank")
+        except Exception:
+            await self._discard(page)
+        else:
+            entry = self._page_index.get(page)
+            if entry:
+                browser, _, profile = entry
+                self._idle[profile].put_nowait((browser, page))
+        finally:
+            self._slot_sem.release()
+
+    async def _discard(self, page):
+        """Close a broken page and drop it from the pool."""
+        empty_browser = None
         async with self.lock:
-            for browser, pages in self.browsers:
-                if page in pages:
-                    try:
-                        await page.close()
-                    except Exception:
-                        pass
-                    pages.remove(page)
-                    # Optionally close browser if no tabs left
-                    if not pages:
-                        try:
-                            await browser.close()
-                        except Exception:
-                            pass
-                        self.browsers.remove((browser, pages))
-                    return
+            entry = self._page_index.pop(page, None)
+            if entry:
+                browser, pages, _ = entry
+                pages.remove(page)
+                # Optionally close browser if no tabs left (or on the way)
+                if not pages and not self._pending.get(browser):
+                    self.browsers.remove((browser, pages))
+                    self.contexts.pop(browser, None)
+                    self._pending.pop(browser, None)
+                    empty_browser = browser
+
+        # Close outside the lock so other acquires/releases are not held up
+        with suppress(Exception):
+            await page.close()
+        if empty_browser:
+            with suppress(Exception):
+                await empty_browser.close()
 
     async def close(self):
+        # Snapshot and reset the pool state under the lock, then tear
+        # everything down concurrently outside it
         async with self.lock:
-            for browser, pages in self.browsers:
-                for page in pages:
-                    try:
-                        await page.close()
-                    except Exception:
-                        pass
-                try:
-                    await browser.close()
-                except Exception:
-                    pass
+            browsers = list(self.browsers)
             self.browsers.clear()
-            if self.playwright:
-                await self.playwright.stop()
-                self.playwright = None
+            self.contexts.clear()
+            self._page_index.clear()
+            self._idle = {profile: asyncio.Queue() for profile in self.PROFILES}
+            self.ready = False
+
+        await asyncio.gather(
+            *(page.close() for _, pages in browsers for page in pages),
+            return_exceptions=True,
+        )
+        await asyncio.gather(
+            *(browser.close() for browser, _ in browsers), return_exceptions=True
+        )
+
+        # The Playwright driver is shared process-wide; stop_playwright() ends it
+        self.playwright = None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the HTTP client shared by PSI calls and preflight checks."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=32, keepalive_expiry=60),
+    )
+
+
+def _is_unreachable(error: BaseException) -> bool:
+    """
+    Whether a connection error means nothing answers at the URL.
+
+    Only name-resolution and refused-connection failures count. TLS errors
+    do not, since Chromium accepts certificates (private CAs, missing
+    intermediates) that httpx rejects.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, (socket.gaierror, ConnectionRefusedError)):
+            return True
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return False
 
 
 class WebsiteAnalyzer:
-    def __init__(self, save_screenshots=False, chromium_pool=None, config=None):
+    # Shared across instances since an analyzer is created per request
+    _psi_slots = None
+
+    # Every instance attribute is declared and set in __init__
+    __slots__ = (
+        "config",
+        "save_screenshots",
+        "chromium_pool",
+        "_owns_http_client",
+        "http_client",
+        "ai_analyzer",
+        "desktop_screenshot_path",
+        "mobile_screenshot_path",
+        "desktop_screenshot_bytes",
+        "mobile_screenshot_bytes",
+        "failure",
+    )
+
+    def __init__(
+        self, save_screenshots=False, chromium_pool=None, config=None, http_client=None
+    ):
         self.config = config or default_config
         self.config.validate()  # Validate configuration on startup
 
         self.save_screenshots = save_screenshots
         self.chromium_pool = chromium_pool
+        # Long-lived client shared across analyses so PSI calls reuse
+        # connections; one is created (and owned) if none is passed in
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or create_http_client()
 
         # Initialize AI analyzer
         self.ai_analyzer = AIScreenshotAnalyzer(self.config)
@@ -104,12 +404,18 @@ class WebsiteAnalyzer:
         # Track screenshot paths for output
         self.desktop_screenshot_path = None
         self.mobile_screenshot_path = None
+        # Captured screenshot bytes, kept so callers never re-read the files
+        self.desktop_screenshot_bytes = None
+        self.mobile_screenshot_bytes = None
+        # Why the last analysis failed: None, "website" (unreachable or did
+        # not load) or "ai" (the provider call failed)
+        self.failure = None
 
     async def get_lighthouse_metrics(self, url):
         """Get Lighthouse performance metrics using PageSpeed Insights (PSI) only."""
         print("⚡ Running Lighthouse analysis (PSI)...")
 
-        if os.getenv("LIGHTHOUSE_MODE", "psi").lower() == "disabled":
+        if self.config.lighthouse_mode == "disabled":
             print("ℹ️  Lighthouse disabled via LIGHTHOUSE_MODE=disabled")
             return {"available": False}
 
@@ -118,56 +424,21 @@ class WebsiteAnalyzer:
             result = await self._run_lighthouse_audit_psi(url)
 
             if result:
-                # Extract metrics from Lighthouse response structure
-                fcp_seconds = None
-                performance_score = None
-                lcp_seconds = None
-                cls_value = None
-                tbt_ms = None
-
-                # Extract performance score
-                if "categories" in result and "performance" in result["categories"]:
-                    performance_score = (
-                        result["categories"]["performance"]["score"] * 100
-                    )
-
                 # Extract metrics from the Lighthouse response structure
-                if "audits" in result:
-                    # First Contentful Paint
-                    if "first-contentful-paint" in result["audits"]:
-                        fcp_audit = result["audits"]["first-contentful-paint"]
-                        if "numericValue" in fcp_audit:
-                            fcp_ms = fcp_audit["numericValue"]
-                            fcp_seconds = fcp_ms / 1000
-
-                    # Largest Contentful Paint
-                    if "largest-contentful-paint" in result["audits"]:
-                        lcp_audit = result["audits"]["largest-contentful-paint"]
-                        if "numericValue" in lcp_audit:
-                            lcp_ms = lcp_audit["numericValue"]
-                            lcp_seconds = lcp_ms / 1000
-
-                    # Cumulative Layout Shift
-                    if "cumulative-layout-shift" in result["audits"]:
-                        cls_audit = result["audits"]["cumulative-layout-shift"]
-                        if "numericValue" in cls_audit:
-                            cls_value = cls_audit["numericValue"]
-
-                    # Total Blocking Time
-                    if "total-blocking-time" in result["audits"]:
-                        tbt_audit = result["audits"]["total-blocking-time"]
-                        if "numericValue" in tbt_audit:
-                            tbt_ms = tbt_audit["numericValue"]
+                metrics = dict.fromkeys((name for _, name, _ in METRIC_SPEC), None)
+                audits = result.get("audits", {})
+                for audit_key, name, divisor in METRIC_SPEC:
+                    audit = audits.get(audit_key)
+                    if audit and "numericValue" in audit:
+                        metrics[name] = audit["numericValue"] / divisor
 
-                return {
-                    "fcp_seconds": fcp_seconds,
-                    "lcp_seconds": lcp_seconds,
-                    "cls_value": cls_value,
-                    "tbt_ms": tbt_ms,
-                    "performance_score": performance_score,
-                    "available": True,
-                    "raw": result,
-                }
+                # Extract performance score
+                performance = result.get("categories", {}).get("performance")
+                metrics["performance_score"] = (
+                    performance["score"] * 100 if performance else None
+                )
+                metrics["available"] = True
+                return metrics
 
             return {"available": False}
 
@@ -184,32 +455,56 @@ class WebsiteAnalyzer:
         """Run Lighthouse via Google PageSpeed Insights API.
         Returns the `lighthouseResult` object or None.
         """
-        api_key = os.getenv("PSI_API_KEY")
+        api_key = self.config.psi_api_key
         base_url = "https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
         params = {
             "url": url,
             "strategy": "mobile",  # can be parameterized later
             "category": "performance",
+            "fields": PSI_FIELDS,
         }
         if api_key:
             params["key"] = api_key
 
+        # Bound concurrent PSI calls so batch runs queue here instead of
+        # bursting into the API's rate limits
+        if WebsiteAnalyzer._psi_slots is None:
+            WebsiteAnalyzer._psi_slots = asyncio.Semaphore(
+                self.config.psi_max_concurrency
+            )
+
+        # Don't queue forever: an analysis holds its API slot while it waits
+        # here, so past the queue timeout it goes on without Lighthouse
         try:
-            timeout = httpx.Timeout(self.config.lighthouse_timeout)
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                resp = await client.get(base_url, params=params)
-                if resp.status_code != 200:
-                    print(
-                        f"❌ PSI error: {resp.status_code} {resp.text[:200]} (did you set PSI_API_KEY?)"
-                    )
-                    return None
-                data = resp.json()
-                result = data.get("lighthouseResult")
-                if not result:
-                    print("❌ PSI response missing lighthouseResult")
-                    return None
-                print("✅ PSI Lighthouse audit completed successfully")
-                return result
+            await asyncio.wait_for(
+                WebsiteAnalyzer._psi_slots.acquire(),
+                timeout=self.config.psi_queue_timeout,
+            )
+        except asyncio.TimeoutError:
+            print(
+                f"⚠️  PSI busy for {self.config.psi_queue_timeout}s, skipping Lighthouse"
+            )
+            return None
+
+        try:
+            resp = await self.http_client.get(
+                base_url,
+                params=params,
+                timeout=httpx.Timeout(self.config.lighthouse_timeout),
+            )
+            if resp.status_code != 200:
+                print(
+                    f"❌ PSI error: {resp.status_code} {resp.text[:200]} (did you set PSI_API_KEY?)"
+                )
+                return None
+            # Parse the raw body directly; skips the text decode resp.json() does
+            data = orjson.loads(resp.content)
+            result = data.get("lighthouseResult")
+            if not result:
+                print("❌ PSI response missing lighthouseResult")
+                return None
+            print("✅ PSI Lighthouse audit completed successfully")
+            return result
         except httpx.TimeoutException:
             print(
                 f"❌ PSI audit timed out after {self.config.lighthouse_timeout} seconds"
@@ -218,6 +513,8 @@ class WebsiteAnalyzer:
         except Exception as e:
             print(f"❌ PSI request failed: {e}")
             return None
+        finally:
+            WebsiteAnalyzer._psi_slots.release()
 
     async def analyze_website(self, url):
         """
@@ -227,43 +524,111 @@ class WebsiteAnalyzer:
             url (str): The website URL to analyze
 
         Returns:
-            tuple: (analysis_results, load_time, lighthouse_data)
+            tuple: (analysis_results, load_time, lighthouse_data). On failure
+            analysis_results is an error message and self.failure says why.
         """
         print(f"🔍 Analyzing: {url}")
+        self.failure = None
 
-        # Step 1: Get Lighthouse performance metrics
-        lighthouse_data = await self._get_lighthouse_data(url)
+        # Step 1: Start Lighthouse in the background; it is independent of
+        # the preflight and screenshots and only needed for the AI analysis
+        lighthouse_task = asyncio.create_task(self._get_lighthouse_data(url))
 
-        # Step 2: Initialize screenshot paths
-        screenshot_paths = self._setup_screenshot_paths()
+        try:
+            # Step 2: Cheap reachability check before spending browser time
+            preflight_error = await self._preflight(url)
+            if preflight_error:
+                self.failure = "website"
+                await self._cancel(lighthouse_task)
+                return preflight_error, 0.0, {"available": False}
+
+            # Step 3: Capture screenshots (in memory) and measure load time
+            screenshot_results = await self._capture_screenshots(url)
+        except BaseException:
+            await self._cancel(lighthouse_task)
+            raise
 
-        # Step 3: Capture screenshots and measure load time
-        screenshot_results = await self._capture_screenshots(url, screenshot_paths)
+        lighthouse_data = await lighthouse_task
 
         if not screenshot_results["success"]:
+            self.failure = "website"
             return (
                 screenshot_results["error_message"],
                 screenshot_results["load_time"],
                 lighthouse_data,
             )
 
+        self.desktop_screenshot_bytes = screenshot_results["desktop"]
+        self.mobile_screenshot_bytes = screenshot_results["mobile"]
+
         # Step 4: Perform AI analysis
         print("🤖 Analyzing with AI...")
-        analysis_results = await self.ai_analyzer.analyze_screenshots(
-            screenshot_results["desktop_path"],
-            screenshot_results["mobile_path"],
-            url,
-            screenshot_results["load_time"],
-            lighthouse_data,
-        )
-
-        # Step 5: Handle screenshot cleanup/saving
-        self._handle_screenshot_persistence(
-            screenshot_results["desktop_path"], screenshot_results["mobile_path"], url
-        )
+        try:
+            analysis_results = await self.ai_analyzer.analyze_screenshots(
+                screenshot_results["desktop"],
+                screenshot_results["mobile"],
+                url,
+                screenshot_results["load_time"],
+                lighthouse_data,
+            )
+        except AIAnalysisUnavailableError:
+            self.failure = "ai"
+            analysis_results = "AI analysis not available"
+
+        # Step 5: Save screenshots to disk if requested
+        if self.save_screenshots:
+            await self._save_screenshots_with_names(
+                screenshot_results["desktop"], screenshot_results["mobile"], url
+            )
 
         return analysis_results, screenshot_results["load_time"], lighthouse_data
 
+    @staticmethod
+    async def _cancel(task):
+        """Cancel a background task and wait for it to finish."""
+        task.cancel()
+        with suppress(BaseException):
+            await task
+
+    def get_screenshot_bytes(self, kind: str):
+        """Return the captured 'desktop' or 'mobile' screenshot bytes, if any."""
+        if kind == "desktop":
+            return self.desktop_screenshot_bytes
+        if kind == "mobile":
+            return self.mobile_screenshot_bytes
+        raise ValueError("kind must be 'desktop' or 'mobile'")
+
+    async def _preflight(self, url: str):
+        """
+        Send a HEAD request to catch unreachable hosts before launching a page.
+
+        Returns:
+            str: Error message if the host could not be reached, else None
+        """
+        if not self.config.preflight_check:
+            return None
+
+        try:
+            await self.http_client.head(
+                url,
+                follow_redirects=True,
+                timeout=httpx.Timeout(self.config.preflight_timeout),
+            )
+        except httpx.ConnectError as e:
+            if _is_unreachable(e):
+                print(f"❌ Preflight check failed: {e}")
+                return self._handle_website_error(url, str(e))
+            # TLS failures land here too; Chromium may still load the page
+        except httpx.HTTPError:
+            # Slow or HEAD-hostile servers still get a full browser attempt
+            pass
+        return None
+
+    async def aclose(self):
+        """Close the HTTP client if this analyzer created it."""
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
     async def _get_lighthouse_data(self, url: str) -> dict:
         """Get Lighthouse performance metrics with proper error handling."""
         try:
@@ -282,20 +647,7 @@ class WebsiteAnalyzer:
             print(f"⚠️  Lighthouse analysis failed: {e}")
             return {"available": False}
 
-    def _setup_screenshot_paths(self) -> dict:
-        """Setup screenshot file paths and ensure directory exists."""
-        screenshots_dir = Path("screenshots")
-        # Ensure parent directories exist (robust on first run in fresh containers)
-        screenshots_dir.mkdir(parents=True, exist_ok=True)
-
-        # Use unique temp names per request to avoid races across concurrent requests
-        uid = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        return {
-            "desktop": screenshots_dir / f"temp_{uid}_desktop.png",
-            "mobile": screenshots_dir / f"temp_{uid}_mobile.png",
-        }
-
-    async def _capture_screenshots(self, url: str, screenshot_paths: dict) -> dict:
+    async def _capture_screenshots(self, url: str) -> dict:
         """
         Capture desktop and mobile screenshots with proper error handling.
 
@@ -303,141 +655,233 @@ class WebsiteAnalyzer:
             dict: {
                 'success': bool,
                 'load_time': float,
-                'desktop_path': Path,
-                'mobile_path': Path,
+                'desktop': bytes,
+                'mobile': bytes,
                 'error_message': str (if success=False)
             }
         """
         # Ensure ChromiumPool is started
         await self.chromium_pool.start()
 
-        # Capture desktop screenshot first
-        desktop_result = await self._capture_single_screenshot(
-            url, screenshot_paths["desktop"], "desktop"
-        )
+        if self.config.reuse_page_for_mobile:
+            # Load the page once; the mobile shot is taken by resizing the
+            # already-loaded desktop page when the site is responsive
+            desktop_result = await self._capture_single_screenshot(
+                url, "desktop", capture_mobile=True
+            )
+            mobile_result = {"success": True, "image": None}
+            if desktop_result["success"]:
+                if desktop_result["mobile_image"]:
+                    mobile_result["image"] = desktop_result["mobile_image"]
+                else:
+                    mobile_result = await self._capture_single_screenshot(url, "mobile")
+        else:
+            # Capture desktop and mobile screenshots concurrently
+            desktop_result, mobile_result = await asyncio.gather(
+                self._capture_single_screenshot(url, "desktop"),
+                self._capture_single_screenshot(url, "mobile"),
+                return_exceptions=True,
+            )
+
+        if isinstance(desktop_result, BaseException):
+            raise desktop_result
 
         if not desktop_result["success"]:
             return {
                 "success": False,
                 "load_time": desktop_result["load_time"],
                 "error_message": desktop_result["error_message"],
-                "desktop_path": None,
-                "mobile_path": None,
+                "desktop": None,
+                "mobile": None,
             }
 
-        # Capture mobile screenshot only if desktop was successful
-        mobile_result = await self._capture_single_screenshot(
-            url, screenshot_paths["mobile"], "mobile"
-        )
+        if isinstance(mobile_result, BaseException):
+            mobile_result = {"success": False, "error_message": str(mobile_result)}
 
         # If mobile fails, use desktop screenshot as fallback
         if not mobile_result["success"]:
             print(f"⚠️  Mobile screenshot failed: {mobile_result['error_message']}")
-            try:
-                import shutil
-
-                shutil.copy2(screenshot_paths["desktop"], screenshot_paths["mobile"])
-                print("📱 Using desktop screenshot as mobile fallback")
-            except Exception as e:
-                print(f"⚠️  Fallback screenshot creation failed: {e}")
+            print("📱 Using desktop screenshot as mobile fallback")
+            mobile_result["image"] = desktop_result["image"]
 
         return {
             "success": True,
             "load_time": desktop_result["load_time"],
-            "desktop_path": screenshot_paths["desktop"],
-            "mobile_path": screenshot_paths["mobile"],
+            "desktop": desktop_result["image"],
+            "mobile": mobile_result["image"],
         }
 
     async def _capture_single_screenshot(
-        self, url: str, screenshot_path: Path, device_type: str
+        self, url: str, device_type: str, capture_mobile: bool = False
     ) -> dict:
         """
         Capture a single screenshot for desktop or mobile.
 
         Args:
             url (str): Website URL
-            screenshot_path (Path): Path to save screenshot
             device_type (str): 'desktop' or 'mobile'
+            capture_mobile (bool): Also try to capture the mobile screenshot
+                from the same page by resizing it
 
         Returns:
             dict: {
                 'success': bool,
                 'load_time': float,
+                'image': bytes,
+                'mobile_image': bytes (None unless captured in place),
                 'error_message': str (if success=False)
             }
         """
-        browser = None
-        page = None
         load_time = 0.0
+        mobile_image = None
 
         try:
-            # Acquire browser page from pool
-            browser, page = await self.chromium_pool.acquire()
-
-            print(f"📱 Taking {device_type} screenshot...")
-
-            # Configure page based on device type
-            if device_type == "desktop":
-                await page.set_viewport_size(self.config.desktop_viewport)
-            else:  # mobile
-                await page.set_viewport_size(self.config.mobile_viewport)
-                await page.set_extra_http_headers(
-                    {"User-Agent": self.config.mobile_user_agent}
+            # Borrow a page from the pool; its context already carries the
+            # viewport and user agent for this device type. The page is
+            # released on every exit path.
+            async with self.chromium_pool.borrow(device_type) as (browser, page):
+                print(f"📱 Taking {device_type} screenshot...")
+
+                # Navigate to URL, then give the load event a bounded tail so
+                # slow third-party resources cannot hold up the capture
+                await page.goto(
+                    url,
+                    wait_until=self.config.wait_until,
+                    timeout=self.config.screenshot_timeout,
                 )
+                try:
+                    await page.wait_for_load_state(
+                        "load", timeout=self.config.load_state_timeout
+                    )
+                except PlaywrightTimeoutError:
+                    print(f"⚠️  {device_type.capitalize()} load event still pending")
+                load_time = await self._navigation_load_time(page)
 
-            # Navigate to URL and measure load time
-            start_time = datetime.now()
-            await page.goto(
-                url,
-                wait_until="domcontentloaded",
-                timeout=self.config.screenshot_timeout,
-            )
-            end_time = datetime.now()
-            load_time = (end_time - start_time).total_seconds()
+                # Let web fonts settle so text renders in its final face
+                try:
+                    await asyncio.wait_for(
+                        page.evaluate("() => document.fonts.ready.then(() => null)"),
+                        timeout=self.config.screenshot_timeout / 1000,
+                    )
+                except asyncio.TimeoutError:
+                    print(f"⚠️  {device_type.capitalize()} web fonts did not settle")
+
+                image = await self._take_screenshot(page)
+
+                if capture_mobile:
+                    try:
+                        mobile_image = await self._capture_resized_to_mobile(page)
+                    except Exception as e:
+                        print(f"⚠️  In-place mobile screenshot failed: {e}")
 
-            # Take screenshot
-            await page.screenshot(path=screenshot_path, full_page=True)
+            return {
+                "success": True,
+                "load_time": load_time,
+                "image": image,
+                "mobile_image": mobile_image,
+                "error_message": None,
+            }
 
-            return {"success": True, "load_time": load_time, "error_message": None}
+        except PlaywrightTimeoutError as e:
+            print(f"❌ {device_type.capitalize()} screenshot timed out: {e}")
+            return {
+                "success": False,
+                "load_time": load_time,
+                "image": None,
+                "mobile_image": None,
+                "error_message": self._handle_website_timeout(url),
+            }
 
         except Exception as e:
             error_message = str(e)
             print(f"❌ {device_type.capitalize()} screenshot failed: {error_message}")
-
-            # Determine error type and return appropriate message
-            if "Timeout" in error_message or "timeout" in error_message.lower():
-                return {
-                    "success": False,
-                    "load_time": load_time,
-                    "error_message": self._handle_website_timeout(url),
-                }
+            if _TIMEOUT_RE.search(error_message):
+                error_message = self._handle_website_timeout(url)
             else:
+                error_message = self._handle_website_error(url, error_message)
+            return {
+                "success": False,
+                "load_time": load_time,
+                "image": None,
+                "mobile_image": None,
+                "error_message": error_message,
+            }
+
+    async def _navigation_load_time(self, page) -> float:
+        """
+        Read the page load time in seconds from PerformanceNavigationTiming,
+        so it matches what the browser (and DevTools) reports.
+        """
+        timing = await page.evaluate(
+            """() => {
+                const n = performance.getEntriesByType('navigation')[0];
+                if (!n) return null;
                 return {
-                    "success": False,
-                    "load_time": load_time,
-                    "error_message": self._handle_website_error(url, error_message),
-                }
+                    dcl: n.domContentLoadedEventEnd,
+                    load: n.loadEventEnd,
+                    ttfb: n.responseStart,
+                };
+            }"""
+        )
+        if not timing:
+            return 0.0
+        # loadEventEnd is 0 until the load event finishes, which can happen
+        # with earlier wait conditions; fall back to DOMContentLoaded then
+        return (timing["load"] or timing["dcl"]) / 1000
+
+    async def _capture_resized_to_mobile(self, page):
+        """
+        Take the mobile screenshot from an already-loaded page by resizing it.
+
+        Only pages that declare a meta viewport are treated as responsive;
+        for the rest this returns None and the caller falls back to a fresh
+        mobile navigation. The page keeps the desktop user agent, so this is
+        opt-in (reuse_page_for_mobile) for sites known not to sniff it.
+        """
+        has_meta_viewport = await page.evaluate(
+            "() => document.querySelector('meta[name=\"viewport\"]') !== null"
+        )
+        if not has_meta_viewport:
+            return None
 
+        print("📱 Taking mobile screenshot from the loaded page...")
+        try:
+            await page.set_viewport_size(self.config.mobile_viewport)
+            await page.evaluate("() => window.dispatchEvent(new Event('resize'))")
+            return await self._take_screenshot(page)
         finally:
-            # Always release the page back to pool
-            if page:
-                try:
-                    await self.chromium_pool.release(page)
-                except Exception as e:
-                    print(f"⚠️  Failed to release {device_type} page: {e}")
-
-    def _handle_screenshot_persistence(
-        self, desktop_path: Path, mobile_path: Path, url: str
-    ) -> None:
-        """Handle screenshot cleanup or saving based on configuration."""
-        # Store paths for output
-        self.desktop_screenshot_path = desktop_path
-        self.mobile_screenshot_path = mobile_path
-
-        if not self.save_screenshots:
-            self._cleanup_temp_screenshots(desktop_path, mobile_path)
-        else:
-            self._save_screenshots_with_names(desktop_path, mobile_path, url)
+            # Pages go back to the desktop pool; restore their viewport
+            await page.set_viewport_size(self.config.desktop_viewport)
+
+    async def _take_screenshot(self, page) -> bytes:
+        """Screenshot the full page, clipped to the configured height budget."""
+        if not self.config.full_page_screenshots:
+            # Viewport only: no scroll height probe and no stitched capture
+            return await page.screenshot(**self._screenshot_options())
+
+        # Clip to the height budget so infinite scroll pages cannot blow up
+        # memory and encode time
+        height = await page.evaluate(
+            "(limit) => Math.min(document.documentElement.scrollHeight, limit)",
+            self.config.max_screenshot_height,
+        )
+        clip = {
+            "x": 0,
+            "y": 0,
+            "width": page.viewport_size["width"],
+            "height": max(height, page.viewport_size["height"]),
+        }
+        return await page.screenshot(
+            full_page=True,
+            clip=clip,
+            **self._screenshot_options(),
+        )
+
+    def _screenshot_options(self) -> dict:
+        """Encoder options for page.screenshot based on the configured format."""
+        if self.config.screenshot_format == "jpeg":
+            return {"type": "jpeg", "quality": self.config.screenshot_quality}
+        return {"type": "png"}
 
     def _handle_website_timeout(self, url):
         """Handle website timeout - likely blocked or slow website"""
@@ -469,40 +913,33 @@ class WebsiteAnalyzer:
             "Please verify the URL is correct and the website is accessible."
         )
 
-    def _cleanup_temp_screenshots(self, desktop_screenshot, mobile_screenshot):
-        """Remove temporary screenshots after analysis"""
-        try:
-            if desktop_screenshot.exists():
-                desktop_screenshot.unlink()
-            if mobile_screenshot.exists():
-                mobile_screenshot.unlink()
-            print("🗑️  Temporary screenshots cleaned up")
-        except Exception as e:
-            print(f"⚠️  Cleanup warning: {e}")
-
-    def _save_screenshots_with_names(self, desktop_screenshot, mobile_screenshot, url):
+    async def _save_screenshots_with_names(
+        self, desktop_screenshot: bytes, mobile_screenshot: bytes, url
+    ):
         """Save screenshots with meaningful names when save_screenshots=True"""
         try:
+            screenshots_dir = Path(self.config.screenshot_dir)
+            # Ensure parent directories exist (robust on first run in fresh containers)
+            await asyncio.to_thread(screenshots_dir.mkdir, parents=True, exist_ok=True)
+
             # Create a safe filename from URL
-            safe_url = (
-                url.replace("https://", "")
-                .replace("http://", "")
-                .replace("/", "_")
-                .replace("?", "_")[:50]
-            )
+            for scheme in _URL_SCHEMES:
+                if url.startswith(scheme):
+                    url = url[len(scheme) :]
+                    break
+            safe_url = url.translate(_FILENAME_TRANS)[:50]
             timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+            ext = "jpg" if self.config.screenshot_format == "jpeg" else "png"
 
             # Create permanent names
-            desktop_final = (
-                desktop_screenshot.parent / f"desktop_{safe_url}_{timestamp}.png"
-            )
-            mobile_final = (
-                mobile_screenshot.parent / f"mobile_{safe_url}_{timestamp}.png"
-            )
+            desktop_final = screenshots_dir / f"desktop_{safe_url}_{timestamp}.{ext}"
+            mobile_final = screenshots_dir / f"mobile_{safe_url}_{timestamp}.{ext}"
 
-            # Rename temporary files
-            desktop_screenshot.rename(desktop_final)
-            mobile_screenshot.rename(mobile_final)
+            # Write off the event loop so slow disks don't stall other analyses
+            await asyncio.gather(
+                asyncio.to_thread(desktop_final.write_bytes, desktop_screenshot),
+                asyncio.to_thread(mobile_final.write_bytes, mobile_screenshot),
+            )
 
             # Store paths for output
             self.desktop_screenshot_path = desktop_final
@@ -511,168 +948,91 @@ class WebsiteAnalyzer:
             print(f"📸 Screenshots saved: {desktop_final.name}, {mobile_final.name}")
         except Exception as e:
             print(f"⚠️  Save warning: {e}")
-            # Fallback to cleanup
-            self._cleanup_temp_screenshots(desktop_screenshot, mobile_screenshot)
-
-    async def _ensure_docker_running(self):
-        """Ensure Docker is running, attempt to start if not"""
-        try:
-            # Check if Docker is already running
-            process = await asyncio.create_subprocess_exec(
-                "docker",
-                "info",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
 
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=10)
 
-            if process.returncode == 0:
-                print("✅ Docker is running")
-                return True
-
-        except (asyncio.TimeoutError, FileNotFoundError):
-            pass
-
-        # Docker is not running - check if auto-start is enabled
-        if not self.config.auto_start_docker:
-            print("⚠️  Docker not running and auto-start is disabled")
-            return False
-
-        # Docker is not running, try to start it
-        print("🐳 Docker not running, attempting to start...")
-
-        try:
-            # Detect operating system
-            if sys.platform == "darwin":  # macOS
-                # Try to start Docker Desktop (macOS)
-                if os.path.exists("/Applications/Docker.app"):
-                    print("🚀 Starting Docker Desktop for macOS...")
-                    process = await asyncio.create_subprocess_exec(
-                        "open",
-                        "/Applications/Docker.app",
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
-                    )
-                    await process.communicate()
-
-                    # Wait for Docker to start (up to 60 seconds)
-                    for i in range(12):  # 12 * 5 = 60 seconds
-                        await asyncio.sleep(5)
-                        try:
-                            check_process = await asyncio.create_subprocess_exec(
-                                "docker",
-                                "info",
-                                stdout=asyncio.subprocess.PIPE,
-                                stderr=asyncio.subprocess.PIPE,
-                            )
-                            stdout, stderr = await asyncio.wait_for(
-                                check_process.communicate(), timeout=5
-                            )
-
-                            if check_process.returncode == 0:
-                                print("✅ Docker started successfully!")
-                                return True
-
-                            print(f"⏳ Waiting for Docker to start... ({(i+1)*5}s)")
-
-                        except (asyncio.TimeoutError, Exception):
-                            continue
-
-            elif sys.platform.startswith("linux"):  # Linux (including Ubuntu)
-                # Try with systemctl first (most common on modern Linux)
-                if os.path.exists("/usr/bin/systemctl") or os.path.exists(
-                    "/bin/systemctl"
-                ):
-                    print("🚀 Starting Docker service via systemctl...")
-
-                    # First try without sudo (if user has proper permissions)
-                    try:
-                        systemctl_cmd = "systemctl"
-                        if not os.access("/var/run/docker.sock", os.W_OK):
-                            # Needs elevated permissions
-                            systemctl_cmd = "sudo systemctl"
-
-                        process = await asyncio.create_subprocess_exec(
-                            *systemctl_cmd.split(),
-                            "start",
-                            "docker",
-                            stdout=asyncio.subprocess.PIPE,
-                            stderr=asyncio.subprocess.PIPE,
-                        )
-                        stdout, stderr = await asyncio.wait_for(
-                            process.communicate(), timeout=10
-                        )
-                    except Exception as e:
-                        print(f"Warning: systemctl start attempt failed: {e}")
-
-                    # Check if docker started
-                    await asyncio.sleep(3)
-                    try:
-                        check_process = await asyncio.create_subprocess_exec(
-                            "docker",
-                            "info",
-                            stdout=asyncio.subprocess.PIPE,
-                            stderr=asyncio.subprocess.PIPE,
-                        )
-                        stdout, stderr = await asyncio.wait_for(
-                            check_process.communicate(), timeout=5
-                        )
-
-                        if check_process.returncode == 0:
-                            print("✅ Docker started successfully!")
-                            return True
-                    except Exception as e:
-                        print(f"Warning: Docker check failed: {e}")
-
-                # Try with service command (older Ubuntu/Debian systems)
-                if os.path.exists("/usr/sbin/service") or os.path.exists(
-                    "/sbin/service"
-                ):
-                    print("🚀 Trying to start Docker with service command...")
-                    try:
-                        service_cmd = "service"
-                        if not os.access("/var/run/docker.sock", os.W_OK):
-                            service_cmd = "sudo service"
-
-                        process = await asyncio.create_subprocess_exec(
-                            *service_cmd.split(),
-                            "docker",
-                            "start",
-                            stdout=asyncio.subprocess.PIPE,
-                            stderr=asyncio.subprocess.PIPE,
-                        )
-                        stdout, stderr = await asyncio.wait_for(
-                            process.communicate(), timeout=10
-                        )
-
-                        # Check if docker started
-                        await asyncio.sleep(3)
-                        check_process = await asyncio.create_subprocess_exec(
-                            "docker",
-                            "info",
-                            stdout=asyncio.subprocess.PIPE,
-                            stderr=asyncio.subprocess.PIPE,
-                        )
-                        stdout, stderr = await asyncio.wait_for(
-                            check_process.communicate(), timeout=5
-                        )
-
-                        if check_process.returncode == 0:
-                            print("✅ Docker started successfully!")
-                            return True
-                    except Exception as e:
-                        print(f"Warning: service command attempt failed: {e}")
+async def analyze_url(url, chromium_pool, http_client, config, save_screenshots):
+    """Analyze a single URL and return the CLI output structure."""
+    # Use configuration in WebsiteAnalyzer
+    analyzer = WebsiteAnalyzer(
+        save_screenshots=save_screenshots,
+        chromium_pool=chromium_pool,
+        config=config,
+        http_client=http_client,
+    )
 
-            # If we reached here, none of the methods worked
-            print(
-                "⚠️  Could not start Docker automatically - continuing without Lighthouse"
-            )
-            return False
+    results, load_time, lighthouse_data = await analyzer.analyze_website(url)
+
+    # Extract issues from the results text
+    issues_list = [issue for line in results.splitlines() if (issue := line.strip())]
+
+    # Screenshot paths are only set when the screenshots were saved
+    desktop_path = analyzer.desktop_screenshot_path
+    mobile_path = analyzer.mobile_screenshot_path
+
+    # Create output structure
+    output_data = {
+        "url": url,
+        "loadTime": load_time,
+        "issues": issues_list,
+        "screenshots": {
+            "desktop": str(desktop_path) if desktop_path else None,
+            "mobile": str(mobile_path) if mobile_path else None,
+        },
+        "lighthouse": {"available": False},
+    }
+
+    # Add lighthouse data if available
+    if lighthouse_data and lighthouse_data.get("available"):
+        output_data["lighthouse"] = {
+            "available": True,
+            "performanceScore": lighthouse_data.get("performance_score"),
+            "fcpSeconds": lighthouse_data.get("fcp_seconds"),
+            "lcpSeconds": lighthouse_data.get("lcp_seconds"),
+            "clsValue": lighthouse_data.get("cls_value"),
+            "tbtMs": lighthouse_data.get("tbt_ms"),
+        }
 
-        except Exception as e:
-            print(f"⚠️  Failed to start Docker: {e} - continuing without Lighthouse")
-            return False
+    return output_data
+
+
+def print_report(output_data, screenshot_dir=None):
+    """Print a human-readable report for one analyzed URL."""
+    if output_data.get("error"):
+        print(f"❌ Analysis failed for {output_data['url']}: {output_data['message']}")
+        return
+
+    lighthouse = output_data["lighthouse"]
+    screenshots = output_data["screenshots"]
+    issues_list = output_data["issues"]
+
+    # Collect the report and write it in one call instead of a print per line
+    lines = [
+        "\n" + "=" * 60,
+        "🎯 WEBSITE ANALYSIS RESULTS",
+        "=" * 60,
+        f"🌐 URL: {output_data['url']}",
+        f"⏱️  Load Time: {output_data['loadTime']:.1f} seconds",
+    ]
+    if lighthouse.get("available"):
+        lines.append(f"⚡ Lighthouse FCP: {lighthouse.get('fcpSeconds'):.1f} seconds")
+        lines.append(f"📊 Performance Score: {lighthouse.get('performanceScore')}/100")
+
+    if screenshots["desktop"]:
+        lines.append(f"Desktop screenshot: {screenshots['desktop']}")
+    if screenshots["mobile"]:
+        lines.append(f"Mobile screenshot: {screenshots['mobile']}")
+
+    lines.append("\nISSUES FOUND:")
+    lines.append("-" * 30)
+    if issues_list:
+        lines.extend(f"• {issue}" for issue in issues_list)
+    else:
+        lines.append("✅ No issues found!")
+    lines.append("=" * 60)
+    if screenshot_dir:
+        lines.append(f"📸 Screenshots saved in {screenshot_dir}/")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def main():
@@ -693,12 +1053,30 @@ async def main():
         output_json = True
         args.remove("--json")
 
-    if len(args) != 1:
+    if "--urls-file" in args:
+        index = args.index("--urls-file")
+        if index + 1 >= len(args):
+            print("❌ --urls-file requires a path")
+            sys.exit(1)
+        urls_file = Path(args[index + 1])
+        del args[index : index + 2]
+        args.extend(
+            line.strip()
+            for line in urls_file.read_text().splitlines()
+            if line.strip() and not line.lstrip().startswith("#")
+        )
+
+    if not args:
         print("Usage:")
-        print("  python analyzer.py <website_url> [--save-screenshots] [--json]")
+        print(
+            "  python analyzer.py <website_url> [<website_url> ...] "
+            "[--urls-file <path>] [--save-screenshots] [--json]"
+        )
         print("\nExample:")
         print("  python analyzer.py https://example.com")
         print("  python analyzer.py https://example.com --save-screenshots --json")
+        print("  python analyzer.py https://example.com https://example.org --json")
+        print("  python analyzer.py --urls-file urls.txt --json")
         print("\nConfiguration:")
         print(f"  Max browsers: {config.max_browsers}")
         print(f"  Max tabs per browser: {config.max_tabs_per_browser}")
@@ -706,112 +1084,77 @@ async def main():
         print(f"  Load time threshold: {config.load_time_threshold}s")
         sys.exit(1)
 
-    url = args[0]
-    if not url.startswith(("http://", "https://")):
-        url = "https://" + url
+    urls = [
+        url if url.startswith(("http://", "https://")) else "https://" + url
+        for url in args
+    ]
 
-    # Use configuration in ChromiumPool
+    # One pool and HTTP client shared by every URL in the run
     chromium_pool = ChromiumPool(
         max_browsers=config.max_browsers,
         max_tabs_per_browser=config.max_tabs_per_browser,
+        config=config,
     )
 
-    # Use configuration in WebsiteAnalyzer
-    analyzer = WebsiteAnalyzer(
-        save_screenshots=save_screenshots, chromium_pool=chromium_pool, config=config
-    )
-
-    desktop_path = None
-    mobile_path = None
+    http_client = create_http_client()
 
+    # Launch the browsers this run needs up front, concurrently, instead of
+    # one at a time on first acquire. Failures are left to acquire to retry.
+    tabs_needed = len(urls) * config.tabs_per_analysis
     try:
-        results, load_time, lighthouse_data = await analyzer.analyze_website(url)
-
-        # Extract issues from the results text
-        issues_list = []
-        if results.strip():
-            for line in results.split("\n"):
-                if line.strip():
-                    issues_list.append(line.strip())
-
-        # Check for screenshot paths from the analyzer
-        if (
-            hasattr(analyzer, "desktop_screenshot_path")
-            and analyzer.desktop_screenshot_path
-        ):
-            desktop_path = str(analyzer.desktop_screenshot_path)
-
-        if (
-            hasattr(analyzer, "mobile_screenshot_path")
-            and analyzer.mobile_screenshot_path
-        ):
-            mobile_path = str(analyzer.mobile_screenshot_path)
-
-        # Create output structure
-        output_data = {
-            "url": url,
-            "loadTime": load_time,
-            "issues": issues_list,
-            "screenshots": {"desktop": desktop_path, "mobile": mobile_path},
-            "lighthouse": {"available": False},
-        }
-
-        # Add lighthouse data if available
-        if lighthouse_data and lighthouse_data.get("available"):
-            output_data["lighthouse"] = {
-                "available": True,
-                "performanceScore": lighthouse_data.get("performance_score"),
-                "fcpSeconds": lighthouse_data.get("fcp_seconds"),
-                "lcpSeconds": lighthouse_data.get("lcp_seconds"),
-                "clsValue": lighthouse_data.get("cls_value"),
-                "tbtMs": lighthouse_data.get("tbt_ms"),
-            }
-
-        if output_json:
-            # Output JSON result
-            print(json.dumps(output_data))
-        else:
-            # Output human-readable format for backward compatibility
-            print("\n" + "=" * 60)
-            print("🎯 WEBSITE ANALYSIS RESULTS")
-            print("=" * 60)
-            print(f"🌐 URL: {url}")
-            print(f"⏱️  Load Time: {load_time:.1f} seconds")
-            if lighthouse_data and lighthouse_data.get("available"):
-                print(
-                    f"⚡ Lighthouse FCP: {lighthouse_data.get('fcp_seconds'):.1f} seconds"
-                )
-                print(
-                    f"📊 Performance Score: {lighthouse_data.get('performance_score')}/100"
+        await chromium_pool.warmup(
+            min(config.warm_browsers, -(-tabs_needed // config.max_tabs_per_browser))
+        )
+    except Exception as e:
+        print(f"⚠️  Browser warmup failed: {e}")
+
+    # Feed URLs through a queue to a fixed set of workers; the pool applies
+    # backpressure once every tab is busy
+    queue = asyncio.Queue()
+    for index, url in enumerate(urls):
+        queue.put_nowait((index, url))
+    outputs = [None] * len(urls)
+
+    async def worker():
+        while True:
+            index, url = await queue.get()
+            try:
+                outputs[index] = await analyze_url(
+                    url, chromium_pool, http_client, config, save_screenshots
                 )
+            except Exception as e:
+                outputs[index] = {"error": True, "message": str(e), "url": url}
+            finally:
+                queue.task_done()
 
-            if desktop_path:
-                print(f"Desktop screenshot: {desktop_path}")
-            if mobile_path:
-                print(f"Mobile screenshot: {mobile_path}")
-
-            print("\nISSUES FOUND:")
-            print("-" * 30)
-            if issues_list:
-                for issue in issues_list:
-                    print(f"• {issue}")
-            else:
-                print("✅ No issues found!")
-            print("=" * 60)
-            if save_screenshots:
-                print("📸 Screenshots saved in ./screenshots/")
-            else:
-                print("🗑️  Temporary screenshots cleaned up")
-
-    except Exception as e:
-        error_data = {"error": True, "message": str(e), "url": url}
+    # Each URL holds tabs_per_analysis tabs, so more workers would only queue
+    worker_count = min(len(urls), config.analysis_capacity)
+    workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
 
-        if output_json:
-            print(json.dumps(error_data))
-        else:
-            print(f"❌ Analysis failed: {e}")
+    try:
+        await queue.join()
     finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
         await chromium_pool.close()
+        await http_client.aclose()
+        await stop_playwright()
+        await close_openai_http_client()
+
+    if output_json:
+        # A single URL keeps the original object output; batches emit an array
+        payload = orjson.dumps(outputs[0] if len(outputs) == 1 else outputs)
+        # Write the encoded bytes directly, after any buffered progress text
+        sys.stdout.flush()
+        sys.stdout.buffer.write(payload + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        # Output human-readable format for backward compatibility
+        for output_data in outputs:
+            print_report(
+                output_data, config.screenshot_dir if save_screenshots else None
+            )
 
 
 if __name__ == "__main__":
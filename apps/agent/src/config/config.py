@@ -2,7 +2,11 @@
 
 import os
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Optional
+from dotenv import load_dotenv
+
+# Environment-backed settings are read when the config is built
+load_dotenv()
 
 
 @dataclass
@@ -12,6 +16,10 @@ class Config:
     # Browser Configuration
     max_browsers: int = 4
     max_tabs_per_browser: int = 8
+    warm_browsers: int = 4  # Browsers launched at startup (<= max_browsers)
+    # API analyses running at once; defaults to what the browser pool can serve
+    max_concurrent_analyses: Optional[int] = None
+    batch_max_concurrency: int = 8  # Of those, how many one batch may hold
     screenshot_timeout: int = 30000  # milliseconds
     lighthouse_timeout: int = 300  # seconds
 
@@ -20,8 +28,11 @@ class Config:
     performance_score_threshold: int = 70  # percentage
     fcp_threshold: float = 2.5  # seconds
 
-    # Docker Configuration
-    auto_start_docker: bool = True  # Automatically start Docker if not running
+    # Lighthouse Configuration (read from the environment once, not per request)
+    lighthouse_mode: str = None  # "psi" or "disabled"; LIGHTHOUSE_MODE
+    psi_api_key: Optional[str] = None  # PSI_API_KEY
+    psi_max_concurrency: int = 4  # PSI requests in flight at once
+    psi_queue_timeout: int = 30  # seconds to wait for a PSI slot before skipping
 
     # AI Configuration
     ai_provider: str = "openai"  # "openai" or "gemini"
@@ -31,6 +42,8 @@ class Config:
     openai_max_tokens: int = 1500
     openai_temperature: float = 0.0
     openai_seed: int = 12345
+    openai_image_detail: str = "high"  # Vision detail for the desktop image
+    openai_mobile_image_detail: str = "auto"  # The narrow mobile shot needs less
 
     # Gemini Configuration
     gemini_model: str = "gemini-2.5-flash"
@@ -41,15 +54,58 @@ class Config:
     desktop_viewport: Dict[str, int] = None
     mobile_viewport: Dict[str, int] = None
     mobile_user_agent: str = "Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X)"
+    screenshot_format: str = "jpeg"  # "jpeg" or "png"
+    screenshot_quality: int = 80  # JPEG quality (ignored for PNG)
+    full_page_screenshots: bool = True  # False captures the viewport only
+    max_screenshot_height: int = 8000  # pixels; caps full-page captures
+    screenshot_dir: str = "screenshots"  # Saved screenshots, served at /shots
+
+    # Response Cache Configuration
+    analysis_cache_max_bytes: int = 256 * 1024 * 1024  # Serialized responses
+    analysis_cache_ttl: int = 300  # seconds
+    analysis_cache_stale_ttl: int = 300  # seconds served stale while refreshing
+
+    # Page Load Configuration
+    block_heavy_resources: bool = True  # Abort media, sockets and trackers
+    wait_until: str = "domcontentloaded"  # Playwright goto wait condition
+    load_state_timeout: int = 5000  # milliseconds to wait for load afterwards
+    # Resize the desktop page for mobile instead of a separate navigation.
+    # Off by default: the resized page keeps the desktop user agent, so
+    # sites that adapt their markup server-side would be judged on desktop
+    reuse_page_for_mobile: bool = False
+    preflight_check: bool = True  # HEAD the URL before opening a page
+    preflight_timeout: int = 3  # seconds; only has to catch unreachable hosts
 
     def __post_init__(self):
-        """Set default viewport configurations."""
+        """Set default viewport and environment-backed configurations."""
         if self.desktop_viewport is None:
             self.desktop_viewport = {"width": 1920, "height": 1080}
 
         if self.mobile_viewport is None:
             self.mobile_viewport = {"width": 375, "height": 667}
 
+        if self.lighthouse_mode is None:
+            self.lighthouse_mode = os.getenv("LIGHTHOUSE_MODE", "psi").lower()
+
+        if self.psi_api_key is None:
+            self.psi_api_key = os.getenv("PSI_API_KEY")
+
+        if self.max_concurrent_analyses is None:
+            self.max_concurrent_analyses = self.analysis_capacity
+
+    @property
+    def tabs_per_analysis(self) -> int:
+        """Pool tabs one analysis holds at the same time."""
+        # Desktop and mobile are captured concurrently, one tab each, unless
+        # the mobile shot comes from resizing the desktop page
+        return 1 if self.reuse_page_for_mobile else 2
+
+    @property
+    def analysis_capacity(self) -> int:
+        """How many analyses the browser pool can serve at once."""
+        tabs = self.max_browsers * self.max_tabs_per_browser
+        return max(1, tabs // self.tabs_per_analysis)
+
     def validate(self) -> None:
         """Validate configuration values."""
         if self.max_browsers <= 0:
@@ -58,12 +114,66 @@ class Config:
         if self.max_tabs_per_browser <= 0:
             raise ValueError("max_tabs_per_browser must be positive")
 
+        if not 0 < self.max_concurrent_analyses <= self.analysis_capacity:
+            # More would just queue inside the pool instead of getting a 503
+            raise ValueError(
+                "max_concurrent_analyses must be between 1 and "
+                "max_browsers * max_tabs_per_browser // tabs_per_analysis"
+            )
+
+        if not 0 < self.batch_max_concurrency <= self.max_concurrent_analyses:
+            raise ValueError(
+                "batch_max_concurrency must be between 1 and max_concurrent_analyses"
+            )
+
+        if not 0 <= self.warm_browsers <= self.max_browsers:
+            raise ValueError("warm_browsers must be between 0 and max_browsers")
+
         if self.screenshot_timeout <= 0:
             raise ValueError("screenshot_timeout must be positive")
 
         if self.lighthouse_timeout <= 0:
             raise ValueError("lighthouse_timeout must be positive")
 
+        if self.psi_max_concurrency <= 0:
+            raise ValueError("psi_max_concurrency must be positive")
+
+        if self.psi_queue_timeout < 0:
+            raise ValueError("psi_queue_timeout must be non-negative")
+
+        if self.load_state_timeout < 0:
+            raise ValueError("load_state_timeout must be non-negative")
+
+        if self.preflight_timeout <= 0:
+            raise ValueError("preflight_timeout must be positive")
+
+        if self.analysis_cache_max_bytes <= 0:
+            raise ValueError("analysis_cache_max_bytes must be positive")
+
+        if self.analysis_cache_ttl <= 0:
+            raise ValueError("analysis_cache_ttl must be positive")
+
+        if self.analysis_cache_stale_ttl < 0:
+            raise ValueError("analysis_cache_stale_ttl must be non-negative")
+
+        if self.wait_until not in ["load", "domcontentloaded", "networkidle", "commit"]:
+            raise ValueError(
+                "wait_until must be 'load', 'domcontentloaded', 'networkidle' or 'commit'"
+            )
+
+        if self.screenshot_format not in ["jpeg", "png"]:
+            raise ValueError("screenshot_format must be 'jpeg' or 'png'")
+
+        if not 0 <= self.screenshot_quality <= 100:
+            raise ValueError("screenshot_quality must be between 0 and 100")
+
+        if self.max_screenshot_height <= 0:
+            raise ValueError("max_screenshot_height must be positive")
+
+        for detail in (self.openai_image_detail, self.openai_mobile_image_detail):
+            if detail not in ["low", "high", "auto"]:
+                raise ValueError("OpenAI image detail must be 'low', 'high' or 'auto'")
+
         if self.ai_provider not in ["openai", "gemini"]:
             raise ValueError("ai_provider must be 'openai' or 'gemini'")
 
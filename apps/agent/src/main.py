@@ -1,17 +1,21 @@
 import os
-import base64
+import re
+import hashlib
 import logging
 from typing import Optional, Dict, Any, Union
-from fastapi import FastAPI, Depends, HTTPException, Header, status
-from fastapi.responses import JSONResponse
+from cachetools import TTLCache
+from fastapi import FastAPI, Depends, HTTPException, Header, Response, status
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field, HttpUrl, ValidationError
 from dotenv import load_dotenv
 from pathlib import Path
-from fastapi.responses import JSONResponse
 from typing import Union
 import asyncio
+import time
 import traceback
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -21,24 +25,86 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 
 # Import from our analyzer module
-from analyzer.analyzer import ChromiumPool, WebsiteAnalyzer
+from analyzer.analyzer import (
+    ChromiumPool,
+    WebsiteAnalyzer,
+    create_http_client,
+    stop_playwright,
+)
 from config.config import default_config
+from ai.ai_analyzer import close_openai_http_client
+from utils.encoding import encode_base64, shutdown_encoder_pool
 
 # Create FastAPI app
 app = FastAPI(
     title="UI Analyzer API",
     description="API for analyzing website UI and performance",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
+# Analysis payloads (especially with base64 screenshots) compress well
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+class CachedStaticFiles(StaticFiles):
+    """Let browsers and CDNs cache served files; StaticFiles adds ETag itself"""
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=3600"
+        return response
+
+
+# Saved screenshots are served as static files so clients can fetch (and
+# cache) them by URL instead of receiving them inline. Cache headers are set
+# by the mount itself, so other routes pay nothing for them
+SCREENSHOTS_MOUNT = "/shots"
+app.mount(
+    SCREENSHOTS_MOUNT,
+    CachedStaticFiles(directory=default_config.screenshot_dir, check_dir=False),
+    name="shots",
+)
+
+
+# One non-blank line of AI output, without surrounding whitespace
+_ISSUE_RE = re.compile(r"^[^\S\n]*(\S.*?)[^\S\n]*$", re.MULTILINE)
+
 # Global pool for browser instances - to be initialized on startup
 chromium_pool = None
 
+# Background task warming the pool; requests get 503 until it finishes
+pool_warmup_task = None
+
+# Shared HTTP client for outbound calls (PSI) - to be initialized on startup
+http_client = None
+
+# Recent successful analyses, keyed by the request options that shape them.
+# Entries outlive their freshness TTL so they can be served while stale.
+# Bounded by payload bytes, since responses with base64 screenshots are
+# orders of magnitude larger than those without.
+analysis_cache = TTLCache(
+    maxsize=default_config.analysis_cache_max_bytes,
+    ttl=default_config.analysis_cache_ttl + default_config.analysis_cache_stale_ttl,
+    getsizeof=lambda entry: len(entry[0]),
+)
+# Cache keys with a background refresh in flight, and the tasks running them
+refreshing_keys = set()
+background_tasks = set()
+# Analyses currently running, so concurrent duplicates share one browser run
+inflight_analyses = {}
+# Caps analyses running at once at what the browser pool can serve; excess
+# interactive requests are rejected, batch items queue for a slot
+analysis_slots = asyncio.Semaphore(default_config.max_concurrent_analyses)
+
 
 # Custom exception classes for better error handling
 class AnalysisError(Exception):
     """Base exception for analysis errors"""
 
+    # Slots keep the per-raise instance dict from being allocated
+    __slots__ = ("message", "error_code", "status_code")
+
     def __init__(
         self, message: str, error_code: str = "ANALYSIS_ERROR", status_code: int = 500
     ):
@@ -51,6 +117,8 @@ class AnalysisError(Exception):
 class WebsiteAccessError(AnalysisError):
     """Exception for website access issues"""
 
+    __slots__ = ("url",)
+
     def __init__(self, message: str, url: str):
         super().__init__(message, "WEBSITE_ACCESS_ERROR", 400)
         self.url = url
@@ -59,13 +127,25 @@ class WebsiteAccessError(AnalysisError):
 class ResourceUnavailableError(AnalysisError):
     """Exception for resource unavailability"""
 
+    __slots__ = ()
+
     def __init__(self, message: str):
         super().__init__(message, "RESOURCE_UNAVAILABLE", 503)
 
 
+class OverloadedError(ResourceUnavailableError):
+    """Exception for requests turned away because every analysis slot is busy"""
+
+    __slots__ = ()
+
+    retry_after = 5  # seconds
+
+
 class ValidationError(AnalysisError):
     """Exception for validation errors"""
 
+    __slots__ = ()
+
     def __init__(self, message: str):
         super().__init__(message, "VALIDATION_ERROR", 400)
 
@@ -76,6 +156,9 @@ class AnalysisRequest(BaseModel):
     save_screenshots: bool = Field(
         False, description="Whether to save screenshots permanently"
     )
+    include_base64: bool = Field(
+        False, description="Whether to inline base64 screenshots in the response"
+    )
 
     def validate_url(self) -> None:
         """Additional URL validation"""
@@ -97,16 +180,45 @@ class AnalysisRequest(BaseModel):
             raise ValidationError("URL is too long (maximum 2048 characters)")
 
 
+class BatchAnalysisRequest(BaseModel):
+    urls: list[HttpUrl] = Field(
+        ..., min_length=1, max_length=50, description="The website URLs to analyze"
+    )
+    save_screenshots: bool = Field(
+        False, description="Whether to save screenshots permanently"
+    )
+    include_base64: bool = Field(
+        False, description="Whether to inline base64 screenshots in the response"
+    )
+
+
 # Enhanced response models
+class ScreenshotPair(BaseModel):
+    desktop: Optional[str] = None
+    mobile: Optional[str] = None
+
+
+class Screenshots(BaseModel):
+    paths: ScreenshotPair = ScreenshotPair()
+    urls: ScreenshotPair = ScreenshotPair()
+    base64: ScreenshotPair = ScreenshotPair()
+
+
+class LighthouseSummary(BaseModel):
+    available: bool = False
+    performanceScore: Optional[float] = None
+    fcpSeconds: Optional[float] = None
+    lcpSeconds: Optional[float] = None
+    clsValue: Optional[float] = None
+    tbtMs: Optional[float] = None
+
+
 class AnalysisResponse(BaseModel):
     url: str
     loadTime: float
     issues: list[str] = []
-    screenshots: Dict[str, Dict[str, Optional[str]]] = {
-        "paths": {"desktop": None, "mobile": None},
-        "base64": {"desktop": None, "mobile": None},
-    }
-    lighthouse: Dict[str, Any] = {"available": False}
+    screenshots: Screenshots = Screenshots()
+    lighthouse: LighthouseSummary = LighthouseSummary()
 
 
 class ErrorResponse(BaseModel):
@@ -119,32 +231,66 @@ class ErrorResponse(BaseModel):
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize the Chromium pool on startup"""
-    global chromium_pool
+    """Initialize the Chromium pool and HTTP client on startup"""
+    global chromium_pool, http_client
+    http_client = create_http_client()
     try:
         config = default_config
         config.validate()
         chromium_pool = ChromiumPool(
             max_browsers=config.max_browsers,
             max_tabs_per_browser=config.max_tabs_per_browser,
+            config=config,
         )
-        await chromium_pool.start()
-        logger.info("✅ Chromium pool initialized successfully")
     except Exception as e:
         logger.error(f"❌ Failed to initialize Chromium pool: {e}")
         chromium_pool = None
+        return
+
+    # Start serving right away; browsers launch concurrently in the background
+    global pool_warmup_task
+    pool_warmup_task = asyncio.create_task(warm_chromium_pool(config.warm_browsers))
+
+
+async def warm_chromium_pool(browsers: int) -> None:
+    """Launch the pool's browsers ahead of traffic, retrying with backoff"""
+    delay = 1.0
+    while True:
+        try:
+            await chromium_pool.warmup(browsers)
+            logger.info("✅ Chromium pool initialized successfully")
+            return
+        except Exception as e:
+            logger.error(
+                f"❌ Failed to warm up Chromium pool: {e}; retrying in {delay:.0f}s"
+            )
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 30.0)
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Close the Chromium pool on shutdown"""
-    global chromium_pool
+    """Close the Chromium pool and HTTP client on shutdown"""
+    global chromium_pool, http_client
+    if pool_warmup_task and not pool_warmup_task.done():
+        pool_warmup_task.cancel()
     if chromium_pool:
         try:
             await chromium_pool.close()
             logger.info("✅ Chromium pool closed successfully")
         except Exception as e:
             logger.error(f"❌ Error closing Chromium pool: {e}")
+    await stop_playwright()
+    await close_openai_http_client()
+    if http_client:
+        await http_client.aclose()
+        http_client = None
+    shutdown_encoder_pool()
+
+
+def _now_iso() -> str:
+    """Current UTC time in the gateway's toISOString() format (ms, "Z")"""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
 
 
 def create_error_response(error: AnalysisError) -> ErrorResponse:
@@ -153,73 +299,74 @@ def create_error_response(error: AnalysisError) -> ErrorResponse:
         error_code=error.error_code,
         message=error.message,
         details={"status_code": error.status_code},
-        timestamp=datetime.now().isoformat(),
+        timestamp=_now_iso(),
     )
 
 
-async def cleanup_screenshots_on_error(analyzer: WebsiteAnalyzer) -> None:
-    """Clean up screenshots in case of error"""
-    try:
-        if (
-            hasattr(analyzer, "desktop_screenshot_path")
-            and analyzer.desktop_screenshot_path
-        ):
-            if analyzer.desktop_screenshot_path.exists():
-                analyzer.desktop_screenshot_path.unlink()
-                logger.info("Cleaned up desktop screenshot on error")
-
-        if (
-            hasattr(analyzer, "mobile_screenshot_path")
-            and analyzer.mobile_screenshot_path
-        ):
-            if analyzer.mobile_screenshot_path.exists():
-                analyzer.mobile_screenshot_path.unlink()
-                logger.info("Cleaned up mobile screenshot on error")
-    except Exception as e:
-        logger.warning(f"Failed to cleanup screenshots on error: {e}")
+def screenshot_url(file_path: Optional[Path]) -> Optional[str]:
+    """Public URL of a saved screenshot under the static mount"""
+    if not file_path:
+        return None
+    return f"{SCREENSHOTS_MOUNT}/{file_path.name}"
 
 
-async def encode_screenshot_to_base64(file_path: Path) -> Optional[str]:
-    """Safely encode screenshot to base64 with error handling"""
+async def encode_screenshot_to_base64(data: Optional[bytes]) -> Optional[str]:
+    """Base64-encode captured screenshot bytes with error handling"""
+    if not data:
+        return None
     try:
-        if not file_path or not file_path.exists():
-            return None
-
-        with open(file_path, "rb") as img_file:
-            return base64.b64encode(img_file.read()).decode("utf-8")
+        return await encode_base64(data)
     except Exception as e:
-        logger.error(f"Failed to encode screenshot {file_path}: {e}")
+        logger.error(f"Failed to encode screenshot: {e}")
         return None
 
 
-@app.post(
-    "/analyze",
-    response_model=Union[AnalysisResponse, ErrorResponse],
-)
-async def analyze_website(request: AnalysisRequest):
-    """Analyze a website UI and performance with enhanced error handling"""
-    analyzer = None
-    start_time = datetime.now()
+async def run_analysis(
+    request: AnalysisRequest, wait_for_slot: bool = False
+) -> AnalysisResponse:
+    """
+    Run the analysis pipeline for a validated request and build the response.
+    Interactive requests fail fast when every slot is busy; batch items set
+    wait_for_slot and queue for one instead.
+    """
+    # Step 2: Check resource availability
+    if not chromium_pool:
+        raise ResourceUnavailableError(
+            "Browser pool not initialized. Please try again later."
+        )
+    if not chromium_pool.ready:
+        raise ResourceUnavailableError(
+            "Browser pool is still warming up. Please try again shortly."
+        )
 
+    if wait_for_slot:
+        await analysis_slots.acquire()
+    else:
+        # Fail fast under overload instead of piling up waiters on the pool
+        try:
+            await asyncio.wait_for(analysis_slots.acquire(), timeout=0.5)
+        except asyncio.TimeoutError:
+            raise OverloadedError("Server is busy. Please try again shortly.")
     try:
-        # Step 1: Validate request
-        logger.info(f"Starting analysis for URL: {request.url}")
-        request.validate_url()
+        return await _run_analysis(request)
+    finally:
+        analysis_slots.release()
 
-        # Step 2: Check resource availability
-        if not chromium_pool:
-            raise ResourceUnavailableError(
-                "Browser pool not initialized. Please try again later."
-            )
 
-        # Step 3: Initialize analyzer
-        config = default_config
-        analyzer = WebsiteAnalyzer(
-            save_screenshots=request.save_screenshots,
-            chromium_pool=chromium_pool,
-            config=config,
-        )
+async def _run_analysis(request: AnalysisRequest) -> AnalysisResponse:
+    """Body of run_analysis, run while holding an analysis slot"""
+    start_time = time.perf_counter()
 
+    # Step 3: Initialize analyzer
+    config = default_config
+    analyzer = WebsiteAnalyzer(
+        save_screenshots=request.save_screenshots,
+        chromium_pool=chromium_pool,
+        config=config,
+        http_client=http_client,
+    )
+
+    try:
         # Step 4: Perform analysis with timeout
         url = str(request.url)
         try:
@@ -233,86 +380,226 @@ async def analyze_website(request: AnalysisRequest):
                 408,
             )
 
+        # Failed analyses come back as messages; raise so they are reported
+        # as errors and never cached as results
+        if analyzer.failure == "website":
+            raise WebsiteAccessError(results, url)
+        if analyzer.failure == "ai":
+            raise AnalysisError(
+                "AI analysis is temporarily unavailable. Please try again shortly.",
+                "AI_UNAVAILABLE",
+                503,
+            )
+
         # Step 5: Handle Lighthouse errors
         if isinstance(results, dict) and "lighthouse_error" in results:
             logger.warning(f"Lighthouse analysis failed: {results['lighthouse_error']}")
-            return create_error_response(
-                AnalysisError(
-                    f"Performance analysis failed: {results['lighthouse_error']}",
-                    "LIGHTHOUSE_ERROR",
-                    422,
-                )
+            raise AnalysisError(
+                f"Performance analysis failed: {results['lighthouse_error']}",
+                "LIGHTHOUSE_ERROR",
+                422,
             )
 
         # Step 6: Process results
         issues_list = []
-        if results and isinstance(results, str) and results.strip():
-            issues_list = [line.strip() for line in results.split("\n") if line.strip()]
+        if results and isinstance(results, str):
+            issues_list = _ISSUE_RE.findall(results)
 
-        # Step 7: Encode screenshots with error handling
+        # Step 7: Encode both screenshots concurrently, only if asked for
         desktop_base64 = None
         mobile_base64 = None
-
-        if (
-            hasattr(analyzer, "desktop_screenshot_path")
-            and analyzer.desktop_screenshot_path
-        ):
-            desktop_base64 = await encode_screenshot_to_base64(
-                analyzer.desktop_screenshot_path
-            )
-
-        if (
-            hasattr(analyzer, "mobile_screenshot_path")
-            and analyzer.mobile_screenshot_path
-        ):
-            mobile_base64 = await encode_screenshot_to_base64(
-                analyzer.mobile_screenshot_path
+        if request.include_base64:
+            desktop_base64, mobile_base64 = await asyncio.gather(
+                encode_screenshot_to_base64(analyzer.get_screenshot_bytes("desktop")),
+                encode_screenshot_to_base64(analyzer.get_screenshot_bytes("mobile")),
             )
 
         # Step 8: Build response
-        response_data = {
-            "url": url,
-            "loadTime": load_time,
-            "issues": issues_list,
-            "screenshots": {
-                "paths": {
-                    "desktop": (
-                        str(analyzer.desktop_screenshot_path)
-                        if hasattr(analyzer, "desktop_screenshot_path")
-                        and analyzer.desktop_screenshot_path
-                        else None
-                    ),
-                    "mobile": (
-                        str(analyzer.mobile_screenshot_path)
-                        if hasattr(analyzer, "mobile_screenshot_path")
-                        and analyzer.mobile_screenshot_path
-                        else None
-                    ),
-                },
-                "base64": {"desktop": desktop_base64, "mobile": mobile_base64},
-            },
-            "lighthouse": {"available": False},
-        }
-
-        # Add lighthouse data if available
+        desktop_path = analyzer.desktop_screenshot_path
+        mobile_path = analyzer.mobile_screenshot_path
+        lighthouse = LighthouseSummary()
         if lighthouse_data and lighthouse_data.get("available"):
-            response_data["lighthouse"] = {
-                "available": True,
-                "performanceScore": lighthouse_data.get("performance_score"),
-                "fcpSeconds": lighthouse_data.get("fcp_seconds"),
-                "lcpSeconds": lighthouse_data.get("lcp_seconds"),
-                "clsValue": lighthouse_data.get("cls_value"),
-                "tbtMs": lighthouse_data.get("tbt_ms"),
-            }
+            lighthouse = LighthouseSummary(
+                available=True,
+                performanceScore=lighthouse_data.get("performance_score"),
+                fcpSeconds=lighthouse_data.get("fcp_seconds"),
+                lcpSeconds=lighthouse_data.get("lcp_seconds"),
+                clsValue=lighthouse_data.get("cls_value"),
+                tbtMs=lighthouse_data.get("tbt_ms"),
+            )
+
+        response_data = AnalysisResponse(
+            url=url,
+            loadTime=load_time,
+            issues=issues_list,
+            screenshots=Screenshots(
+                paths=ScreenshotPair(
+                    desktop=str(desktop_path) if desktop_path else None,
+                    mobile=str(mobile_path) if mobile_path else None,
+                ),
+                urls=ScreenshotPair(
+                    desktop=screenshot_url(desktop_path),
+                    mobile=screenshot_url(mobile_path),
+                ),
+                base64=ScreenshotPair(desktop=desktop_base64, mobile=mobile_base64),
+            ),
+            lighthouse=lighthouse,
+        )
 
         # Log successful analysis
-        analysis_time = (datetime.now() - start_time).total_seconds()
+        analysis_time = time.perf_counter() - start_time
         logger.info(
             f"Analysis completed successfully in {analysis_time:.2f}s for {url}"
         )
 
         return response_data
 
+    finally:
+        await analyzer.aclose()
+
+
+async def coalesced_analysis(
+    cache_key: tuple, request: AnalysisRequest, wait_for_slot: bool = False
+) -> AnalysisResponse:
+    """Run an analysis, or join the identical one that is already running"""
+    task = inflight_analyses.get(cache_key)
+    if task is None:
+        task = asyncio.create_task(run_analysis(request, wait_for_slot))
+        inflight_analyses[cache_key] = task
+        task.add_done_callback(lambda _: inflight_analyses.pop(cache_key, None))
+    else:
+        logger.info(f"Joining in-flight analysis for URL: {request.url}")
+    # Shield so one caller going away does not cancel the run for the others
+    return await asyncio.shield(task)
+
+
+def cache_analysis(cache_key: tuple, response_data: AnalysisResponse) -> tuple:
+    """
+    Serialize and cache an analysis; it is fresh for the TTL, then served
+    stale a while. Returns the (payload, etag) pair.
+    """
+    # Typed models serialize straight from pydantic's core, no dict round trip
+    payload = response_data.model_dump_json().encode()
+    etag = f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+    fresh_until = time.monotonic() + default_config.analysis_cache_ttl
+    if len(payload) <= analysis_cache.maxsize:
+        analysis_cache[cache_key] = (payload, etag, fresh_until)
+    return payload, etag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate If-None-Match against our ETag (RFC 9110 weak comparison)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def analysis_response(
+    payload: bytes, etag: str, if_none_match: Optional[str], headers: dict
+) -> Response:
+    """Send a serialized analysis, or 412 if the client already has it"""
+    headers = {"ETag": etag, **headers}
+    # /analyze is a POST, where a matching If-None-Match is a failed
+    # precondition (RFC 9110 13.1.2) rather than a 304
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=412, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
+async def refresh_analysis(cache_key: tuple, request: AnalysisRequest) -> None:
+    """Re-run a stale cached analysis in the background"""
+    try:
+        cache_analysis(cache_key, await coalesced_analysis(cache_key, request))
+        logger.info(f"Refreshed cached analysis for URL: {request.url}")
+    except Exception as e:
+        logger.warning(f"Background refresh failed for {request.url}: {e}")
+    finally:
+        refreshing_keys.discard(cache_key)
+
+
+async def get_analysis(request: AnalysisRequest, wait_for_slot: bool = False) -> tuple:
+    """
+    Serve an analysis from the cache, or run it (sharing any identical run
+    already in flight). Returns (payload, etag, headers).
+    """
+    # The host is already lowercased by HttpUrl; paths stay case-sensitive,
+    # so only a trailing slash is normalized away
+    cache_key = (
+        str(request.url).rstrip("/"),
+        request.save_screenshots,
+        request.include_base64,
+    )
+    cached = analysis_cache.get(cache_key)
+    if cached is not None:
+        payload, etag, fresh_until = cached
+        remaining = fresh_until - time.monotonic()
+        if remaining > 0:
+            logger.info(f"Cache hit for URL: {request.url}")
+            return (
+                payload,
+                etag,
+                {
+                    "X-Cache": "HIT",
+                    "Cache-Control": f"public, max-age={int(remaining)}",
+                },
+            )
+
+        # Stale: answer now and refresh once in the background
+        logger.info(f"Serving stale analysis for URL: {request.url}")
+        if cache_key not in refreshing_keys:
+            refreshing_keys.add(cache_key)
+            task = asyncio.create_task(refresh_analysis(cache_key, request))
+            background_tasks.add(task)
+            task.add_done_callback(background_tasks.discard)
+        return (
+            payload,
+            etag,
+            {
+                "X-Cache": "STALE",
+                "Cache-Control": "max-age=0, stale-while-revalidate="
+                f"{default_config.analysis_cache_stale_ttl}",
+            },
+        )
+
+    response_data = await coalesced_analysis(cache_key, request, wait_for_slot)
+    payload, etag = cache_analysis(cache_key, response_data)
+    return (
+        payload,
+        etag,
+        {
+            "X-Cache": "MISS",
+            "Cache-Control": f"public, max-age={default_config.analysis_cache_ttl}",
+        },
+    )
+
+
+# Handlers return pre-serialized responses, so response_model validation is
+# skipped; the models are kept for the OpenAPI schema only
+@app.post(
+    "/analyze",
+    response_model=None,
+    responses={
+        200: {"model": Union[AnalysisResponse, ErrorResponse]},
+        503: {"model": ErrorResponse},
+    },
+)
+async def analyze_website(
+    request: AnalysisRequest, if_none_match: Optional[str] = Header(None)
+):
+    """Analyze a website UI and performance with enhanced error handling"""
+    try:
+        # Step 1: Validate request
+        logger.info(f"Starting analysis for URL: {request.url}")
+        request.validate_url()
+
+        payload, etag, headers = await get_analysis(request)
+        return analysis_response(payload, etag, if_none_match, headers)
+
     except ValidationError as e:
         logger.warning(f"Validation error for {request.url}: {e.message}")
         return create_error_response(e)
@@ -321,6 +608,14 @@ async def analyze_website(request: AnalysisRequest):
         logger.warning(f"Website access error for {e.url}: {e.message}")
         return create_error_response(e)
 
+    except OverloadedError as e:
+        logger.warning(f"Rejected {request.url}: {e.message}")
+        return ORJSONResponse(
+            status_code=e.status_code,
+            content=create_error_response(e).model_dump(),
+            headers={"Retry-After": str(e.retry_after)},
+        )
+
     except ResourceUnavailableError as e:
         logger.error(f"Resource unavailable: {e.message}")
         return create_error_response(e)
@@ -350,10 +645,47 @@ async def analyze_website(request: AnalysisRequest):
         )
         return create_error_response(error)
 
-    finally:
-        # Cleanup on error if screenshots shouldn't be saved
-        if analyzer and not request.save_screenshots:
-            await cleanup_screenshots_on_error(analyzer)
+
+@app.post(
+    "/analyze/batch",
+    response_model=None,
+    responses={200: {"model": list[Union[AnalysisResponse, ErrorResponse]]}},
+)
+async def analyze_websites(request: BatchAnalysisRequest):
+    """Analyze several websites concurrently through the shared pool and cache"""
+    logger.info(f"Starting batch analysis for {len(request.urls)} URLs")
+    # Items queue for analysis slots rather than failing, but a batch only
+    # holds a bounded share of them so interactive requests still get through
+    batch_slots = asyncio.Semaphore(default_config.batch_max_concurrency)
+
+    async def analyze_one(url) -> bytes:
+        item = AnalysisRequest(
+            url=url,
+            save_screenshots=request.save_screenshots,
+            include_base64=request.include_base64,
+        )
+        try:
+            item.validate_url()
+            async with batch_slots:
+                payload, _, _ = await get_analysis(item, wait_for_slot=True)
+            return payload
+        except AnalysisError as e:
+            logger.warning(f"Batch analysis error for {url}: {e.message}")
+            error = e
+        except Exception as e:
+            logger.error(f"Unexpected batch error for {url}: {str(e)}")
+            error = AnalysisError(
+                "An unexpected error occurred during analysis. Please try again later.",
+                "INTERNAL_ERROR",
+                500,
+            )
+        return create_error_response(error).model_dump_json().encode()
+
+    # Results are already serialized; join them in request order
+    payloads = await asyncio.gather(*(analyze_one(url) for url in request.urls))
+    return Response(
+        content=b"[" + b",".join(payloads) + b"]", media_type="application/json"
+    )
 
 
 @app.get("/health")
@@ -363,34 +695,34 @@ async def health_check():
         health_status = {
             "status": "ok",
             "message": "API is healthy",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "services": {
                 "chromium_pool": "available" if chromium_pool else "unavailable",
                 "config": "valid" if default_config else "invalid",
             },
+            "ready": bool(chromium_pool and chromium_pool.ready),
         }
 
-        # Additional health checks
+        # Additional health checks; read pool state only, so frequent
+        # liveness probes never start Playwright or launch browsers
         if chromium_pool:
-            try:
-                # Quick test to ensure pool is responsive
-                await chromium_pool.start()
+            if chromium_pool.is_alive():
                 health_status["services"]["chromium_pool"] = "responsive"
-            except Exception as e:
-                health_status["services"]["chromium_pool"] = f"error: {str(e)}"
+            else:
+                health_status["services"]["chromium_pool"] = "degraded"
                 health_status["status"] = "degraded"
 
         return health_status
 
     except Exception as e:
         logger.error(f"Health check failed: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content={
                 "status": "error",
                 "message": "Health check failed",
                 "error": str(e),
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
             },
         )
 
@@ -404,5 +736,21 @@ if __name__ == "__main__":
 
     logger.info("🔒 Running in secure internal network mode")
 
-    logger.info(f"🚀 Starting UI Analyzer API on port {port}")
-    uvicorn.run("server:app", host="0.0.0.0", port=port, reload=True)
+    # Each worker owns its own browser pool and response cache, so scale
+    # workers deliberately; auto-reload is for local development only
+    workers = int(os.getenv("AGENT_WORKERS", "1"))
+    dev_mode = "1" in (os.getenv("DEV"), os.getenv("DEBUG"))
+    if dev_mode:
+        # The reloader runs a single worker
+        workers = 1
+
+    logger.info(f"🚀 Starting UI Analyzer API on port {port} ({workers} workers)")
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        reload=dev_mode,
+    )
@@ -0,0 +1,38 @@
+"""
+Base64 helpers shared by the API and the AI analyzer.
+"""
+
+import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    # SIMD-accelerated, drop-in compatible with the stdlib module
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+
+# Images above this size are encoded in a worker thread
+BASE64_THREAD_THRESHOLD = 256 * 1024
+
+# Dedicated workers for base64 encoding, so large encodes don't queue behind
+# (or hold up) the default executor's file and DNS work
+_encoder_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="base64"
+)
+
+
+async def encode_base64(data: bytes) -> str:
+    """Base64-encode bytes, off the event loop when they are large."""
+    if len(data) <= BASE64_THREAD_THRESHOLD:
+        return base64.b64encode(data).decode("ascii")
+    # Encoding a multi-MB image is CPU bound; keep it off the event loop
+    loop = asyncio.get_running_loop()
+    encoded = await loop.run_in_executor(_encoder_pool, base64.b64encode, data)
+    return encoded.decode("ascii")
+
+
+def shutdown_encoder_pool() -> None:
+    """Stop the encoding workers; call once at shutdown."""
+    _encoder_pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,110 @@
+import asyncio
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from analyzer.analyzer import ChromiumPool
+
+
+class FakePage:
+    def __init__(self, context, rng):
+        self.context = context
+        self.rng = rng
+        self.closed = False
+
+    async def goto(self, url):
+        await asyncio.sleep(self.rng.random() / 1000)
+        # Occasionally fail the reset so the pool discards the page
+        if self.rng.random() < 0.05:
+            raise RuntimeError("page crashed")
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, profile, rng):
+        self.profile = profile
+        self.rng = rng
+
+    async def new_page(self):
+        await asyncio.sleep(self.rng.random() / 1000)
+        return FakePage(self, self.rng)
+
+    async def route(self, pattern, handler):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self, rng):
+        self.rng = rng
+
+    async def new_context(self, viewport=None, user_agent=None):
+        return FakeContext("mobile" if user_agent else "desktop", self.rng)
+
+    def is_connected(self):
+        return True
+
+    async def close(self):
+        pass
+
+
+def make_pool(rng, max_browsers, max_tabs_per_browser):
+    async def launch(**kwargs):
+        await asyncio.sleep(rng.random() / 500)
+        return FakeBrowser(rng)
+
+    pool = ChromiumPool(max_browsers, max_tabs_per_browser)
+    pool.playwright = SimpleNamespace(chromium=SimpleNamespace(launch=launch))
+    return pool
+
+
+def check_capacity(pool):
+    assert len(pool.browsers) <= pool.max_browsers
+    for browser, pages in pool.browsers:
+        assert len(pages) + pool._pending.get(browser, 0) <= pool.max_tabs_per_browser
+
+
+async def test_reuses_a_page_released_while_waiting_for_the_lock():
+    pool = make_pool(random.Random(0), max_browsers=1, max_tabs_per_browser=2)
+    browser, page = await pool.acquire("desktop")
+
+    # Hold the lock so the next acquire gets its slot, misses the idle
+    # queue and parks on the lock; then release a desktop page meanwhile
+    async with pool.lock:
+        waiter = asyncio.create_task(pool.acquire("desktop"))
+        await asyncio.sleep(0)
+        pool._idle["desktop"].put_nowait((browser, page))
+
+    assert await waiter == (browser, page)
+    assert len(pool.browsers[0][1]) == 1
+
+
+@pytest.mark.parametrize("seed", range(5))
+async def test_concurrent_mixed_profiles_keep_the_pool_consistent(seed):
+    rng = random.Random(seed)
+    pool = make_pool(rng, max_browsers=2, max_tabs_per_browser=3)
+    in_use = set()
+
+    async def borrow(profile):
+        async with pool.borrow(profile) as (browser, page):
+            assert page.context.profile == profile
+            assert not page.closed
+            assert page not in in_use
+            in_use.add(page)
+            check_capacity(pool)
+            await asyncio.sleep(rng.random() / 200)
+            in_use.discard(page)
+
+    await asyncio.gather(
+        *(borrow(rng.choice(ChromiumPool.PROFILES)) for _ in range(300))
+    )
+
+    check_capacity(pool)
+    assert pool._slot_sem._value == pool.max_browsers * pool.max_tabs_per_browser
+    assert not any(pool._pending.values())
+    # Every page left in the pool is idle and indexed
+    pages = [page for _, browser_pages in pool.browsers for page in browser_pages]
+    assert sorted(map(id, pages)) == sorted(map(id, pool._page_index))
+    assert sum(queue.qsize() for queue in pool._idle.values()) == len(pages)
@@ -0,0 +1,31 @@
+import pytest
+
+from main import analysis_response, etag_matches
+
+ETAG = '"abc123"'
+
+
+@pytest.mark.parametrize(
+    "header",
+    ['"abc123"', 'W/"abc123"', '"other", "abc123"', ' "other" ,W/"abc123" ', "*"],
+)
+def test_matching_if_none_match(header):
+    assert etag_matches(header, ETAG)
+
+
+@pytest.mark.parametrize("header", [None, "", '"other"', '"abc123-gzip"', 'W/"x"'])
+def test_non_matching_if_none_match(header):
+    assert not etag_matches(header, ETAG)
+
+
+def test_matching_post_is_a_failed_precondition():
+    response = analysis_response(b"{}", ETAG, ETAG, {"X-Cache": "HIT"})
+    assert response.status_code == 412
+    assert response.headers["ETag"] == ETAG
+    assert response.body == b""
+
+
+def test_changed_analysis_is_sent_in_full():
+    response = analysis_response(b"{}", ETAG, '"stale"', {"X-Cache": "HIT"})
+    assert response.status_code == 200
+    assert response.body == b"{}"
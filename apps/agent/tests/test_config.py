@@ -0,0 +1,21 @@
+import pytest
+
+from config.config import Config
+
+
+def test_analysis_slots_default_to_pool_capacity():
+    # Desktop and mobile each hold a tab for the whole capture
+    config = Config(max_browsers=4, max_tabs_per_browser=8)
+    assert config.max_concurrent_analyses == 16
+    config.validate()
+
+
+def test_reused_mobile_page_needs_one_tab_per_analysis():
+    config = Config(max_browsers=4, max_tabs_per_browser=8, reuse_page_for_mobile=True)
+    assert config.max_concurrent_analyses == 32
+
+
+def test_more_analyses_than_the_pool_can_serve_is_rejected():
+    config = Config(max_browsers=4, max_tabs_per_browser=8, max_concurrent_analyses=32)
+    with pytest.raises(ValueError, match="max_concurrent_analyses"):
+        config.validate()
@@ -0,0 +1,64 @@
+import socket
+import ssl
+
+import httpx
+import pytest
+
+from analyzer.analyzer import WebsiteAnalyzer
+
+URL = "https://example.com/"
+
+
+def make_analyzer(handler):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return WebsiteAnalyzer(http_client=client)
+
+
+def connect_error(cause):
+    """Build a ConnectError chained the way httpx raises it."""
+
+    def handler(request):
+        try:
+            raise cause
+        except OSError as e:
+            raise httpx.ConnectError(str(e), request=request) from e
+
+    return handler
+
+
+async def test_reachable_site_passes():
+    analyzer = make_analyzer(lambda request: httpx.Response(200))
+    assert await analyzer._preflight(URL) is None
+
+
+async def test_unresolvable_host_fails():
+    error = socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+    analyzer = make_analyzer(connect_error(error))
+    assert "WEBSITE ACCESS ERROR" in await analyzer._preflight(URL)
+
+
+async def test_refused_connection_fails():
+    # Bind and close a socket to get a port nothing listens on
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    analyzer = WebsiteAnalyzer(http_client=httpx.AsyncClient())
+    try:
+        result = await analyzer._preflight(f"http://127.0.0.1:{port}/")
+    finally:
+        await analyzer.http_client.aclose()
+    assert "WEBSITE ACCESS ERROR" in result
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        ssl.SSLCertVerificationError(
+            1, "certificate verify failed: unable to get local issuer certificate"
+        ),
+        ssl.SSLError(1, "sslv3 alert handshake failure"),
+    ],
+)
+async def test_tls_failure_is_left_to_the_browser(error):
+    analyzer = make_analyzer(connect_error(error))
+    assert await analyzer._preflight(URL) is None
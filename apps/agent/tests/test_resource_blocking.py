@@ -0,0 +1,66 @@
+import pytest
+
+from analyzer.analyzer import _block_heavy_resources
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type="script", navigation=False):
+        self.url = url
+        self.resource_type = resource_type
+        self._navigation = navigation
+
+    def is_navigation_request(self):
+        return self._navigation
+
+
+class FakeRoute:
+    def __init__(self, request):
+        self.request = request
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "abort"
+
+    async def continue_(self):
+        self.outcome = "continue"
+
+
+async def route(url, **kwargs):
+    fake = FakeRoute(FakeRequest(url, **kwargs))
+    await _block_heavy_resources(fake)
+    return fake.outcome
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.googletagmanager.com/gtm.js?id=GTM-1",
+        "https://static.hotjar.com/c/hotjar.js",
+        "https://clarity.ms/tag/abc",
+    ],
+)
+async def test_tracker_subresources_are_blocked(url):
+    assert await route(url) == "abort"
+
+
+async def test_heavy_resource_types_are_blocked():
+    assert (
+        await route("https://example.com/intro.mp4", resource_type="media") == "abort"
+    )
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/?ref=googletagmanager.com",
+        "https://example.com/blog/hotjar.com-review",
+        "https://nothotjar.com/app.js",
+    ],
+)
+async def test_first_party_requests_mentioning_trackers_continue(url):
+    assert await route(url) == "continue"
+
+
+@pytest.mark.parametrize("url", ["https://www.hotjar.com/", "https://mixpanel.com/"])
+async def test_analyzed_tracker_sites_still_load(url):
+    assert await route(url, resource_type="document", navigation=True) == "continue"
@@ -0,0 +1,31 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from main import CachedStaticFiles
+
+
+def make_client(tmp_path):
+    (tmp_path / "desktop.jpg").write_bytes(b"\xff\xd8\xff")
+    app = FastAPI()
+    app.mount("/shots", CachedStaticFiles(directory=tmp_path), name="shots")
+    app.get("/other")(lambda: {"ok": True})
+    return TestClient(app)
+
+
+def test_served_screenshots_are_cacheable(tmp_path):
+    client = make_client(tmp_path)
+    response = client.get("/shots/desktop.jpg")
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "public, max-age=3600"
+
+    revalidated = client.get(
+        "/shots/desktop.jpg", headers={"If-None-Match": response.headers["ETag"]}
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.headers["Cache-Control"] == "public, max-age=3600"
+
+
+def test_other_routes_are_untouched(tmp_path):
+    client = make_client(tmp_path)
+    assert "Cache-Control" not in client.get("/other").headers
+    assert "Cache-Control" not in client.get("/shots/missing.jpg").headers
@@ -0,0 +1,8 @@
+import re
+
+from main import _now_iso
+
+
+def test_timestamps_match_javascript_to_iso_string():
+    # new Date().toISOString() -> 2024-01-02T03:04:05.678Z
+    assert re.fullmatch(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{3}Z", _now_iso())
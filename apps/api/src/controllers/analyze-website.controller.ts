@@ -12,6 +12,8 @@
 import axios, { AxiosError } from "axios";
 import { NextFunction, Request, Response } from "express";
 import fs from "fs";
+import http from "http";
+import https from "https";
 import { HTTP_STATUS_CODE } from "../constants/constants";
 
 // Types for the new error response format
@@ -34,6 +36,10 @@ interface AnalyzerSuccessResponse {
       desktop: string | null;
       mobile: string | null;
     };
+    urls?: {
+      desktop: string | null;
+      mobile: string | null;
+    };
     base64: {
       desktop: string | null;
       mobile: string | null;
@@ -49,17 +55,44 @@ interface AnalyzerSuccessResponse {
   };
 }
 
+// Screenshots may be JPEG or PNG depending on the analyzer configuration
+const toImageDataUrl = (base64: string): string => {
+  if (base64.startsWith('data:')) return base64;
+  // Base64-encoded JPEG data always starts with the FF D8 FF signature
+  const mimeType = base64.startsWith('/9j/') ? 'image/jpeg' : 'image/png';
+  return `data:${mimeType};base64,${base64}`;
+};
+
+// Shared client so repeated analyses reuse keep-alive connections to the analyzer
+const analyzerClient = axios.create({
+  httpAgent: new http.Agent({ keepAlive: true, maxSockets: 20 }),
+  httpsAgent: new https.Agent({ keepAlive: true, maxSockets: 20 }),
+});
+
 // Error code mapping to HTTP status codes
 const ERROR_CODE_MAPPING: Record<string, number> = {
   VALIDATION_ERROR: HTTP_STATUS_CODE.BAD_REQUEST,
   WEBSITE_ACCESS_ERROR: HTTP_STATUS_CODE.BAD_REQUEST,
   RESOURCE_UNAVAILABLE: HTTP_STATUS_CODE.SERVICE_UNAVAILABLE,
+  AI_UNAVAILABLE: HTTP_STATUS_CODE.SERVICE_UNAVAILABLE,
   TIMEOUT_ERROR: HTTP_STATUS_CODE.GATEWAY_TIMEOUT,
   LIGHTHOUSE_ERROR: HTTP_STATUS_CODE.UNPROCESSABLE_ENTITY,
   ANALYSIS_ERROR: HTTP_STATUS_CODE.INTERNAL_SERVER_ERROR,
   INTERNAL_ERROR: HTTP_STATUS_CODE.INTERNAL_SERVER_ERROR,
 };
 
+// User-facing messages for error codes whose agent message is not meant for end users
+const ERROR_MESSAGES: Record<string, string> = {
+  AI_UNAVAILABLE: "Our AI analysis service is temporarily unavailable. Please try again in a few moments.",
+};
+
+// Pass the agent's retry hint on so clients know when to try again
+const forwardRetryAfter = (res: Response, retryAfter: unknown): void => {
+  if (retryAfter) {
+    res.set('Retry-After', String(retryAfter));
+  }
+};
+
 export const analyzeUIController = async (
   req: Request,
   res: Response,
@@ -74,11 +107,12 @@ export const analyzeUIController = async (
     console.log(`Making request to analyzer API at ${apiUrl} for URL: ${url}`);
     
     // Make request to the FastAPI analyzer service with timeout
-    const response = await axios.post(
+    const response = await analyzerClient.post(
       `${apiUrl}/analyze`,
       { 
         url: url, 
-        save_screenshots: true 
+        save_screenshots: true,
+        include_base64: true,
       },
       { 
         headers: {
@@ -98,10 +132,11 @@ export const analyzeUIController = async (
       
       // Map error code to appropriate HTTP status
       const statusCode = ERROR_CODE_MAPPING[errorResponse.error_code] || HTTP_STATUS_CODE.INTERNAL_SERVER_ERROR;
+      forwardRetryAfter(res, response.headers['retry-after']);
       
       res.status(statusCode).json({
         success: false,
-        message: errorResponse.message,
+        message: ERROR_MESSAGES[errorResponse.error_code] || errorResponse.message,
         error: errorResponse.error_code,
       timestamp: errorResponse.timestamp,
       });
@@ -130,19 +165,13 @@ export const analyzeUIController = async (
     // Use base64 screenshots directly from API response
     if (successData.screenshots?.base64?.desktop) {
       // Add data URL prefix if not already present
-      const desktopBase64 = successData.screenshots.base64.desktop;
-      desktopScreenshot = desktopBase64.startsWith('data:') 
-        ? desktopBase64 
-        : `data:image/png;base64,${desktopBase64}`;
+      desktopScreenshot = toImageDataUrl(successData.screenshots.base64.desktop);
       console.log("Received desktop screenshot from API (base64 encoded)");
     }
     
     if (successData.screenshots?.base64?.mobile) {
       // Add data URL prefix if not already present
-      const mobileBase64 = successData.screenshots.base64.mobile;
-      mobileScreenshot = mobileBase64.startsWith('data:') 
-        ? mobileBase64 
-        : `data:image/png;base64,${mobileBase64}`;
+      mobileScreenshot = toImageDataUrl(successData.screenshots.base64.mobile);
       console.log("Received mobile screenshot from API (base64 encoded)");
     }
     
@@ -151,8 +180,7 @@ export const analyzeUIController = async (
       try {
         const desktopPath = successData.screenshots.paths.desktop;
         if (desktopPath && fs.existsSync(desktopPath)) {
-          const desktopBase64 = fs.readFileSync(desktopPath).toString('base64');
-          desktopScreenshot = `data:image/png;base64,${desktopBase64}`;
+          desktopScreenshot = toImageDataUrl(fs.readFileSync(desktopPath).toString('base64'));
           console.log(`Read desktop screenshot from file: ${desktopPath}`);
         }
       } catch (fileError) {
@@ -164,8 +192,7 @@ export const analyzeUIController = async (
       try {
         const mobilePath = successData.screenshots.paths.mobile;
         if (mobilePath && fs.existsSync(mobilePath)) {
-          const mobileBase64 = fs.readFileSync(mobilePath).toString('base64');
-          mobileScreenshot = `data:image/png;base64,${mobileBase64}`;
+          mobileScreenshot = toImageDataUrl(fs.readFileSync(mobilePath).toString('base64'));
           console.log(`Read mobile screenshot from file: ${mobilePath}`);
         }
       } catch (fileError) {
@@ -227,10 +254,11 @@ export const analyzeUIController = async (
         const errorData = axiosError.response.data as any;
         
         console.error(`Analyzer API responded with status ${statusCode}:`, errorData);
+        forwardRetryAfter(res, axiosError.response.headers['retry-after']);
         
         res.status(statusCode).json({
           success: false,
-          message: errorData?.message || "Analysis service error",
+          message: ERROR_MESSAGES[errorData?.error_code] || errorData?.message || "Analysis service error",
           error: errorData?.error_code || "ANALYZER_ERROR",
           details: errorData?.details || null,
         });